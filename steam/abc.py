@@ -30,7 +30,6 @@ from __future__ import annotations
 
 import abc
 import asyncio
-import re
 from collections.abc import Coroutine
 from datetime import datetime
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -48,7 +47,6 @@ from .models import URL, Ban
 from .profile import *
 from .trade import Inventory
 from .utils import (
-    _INVITE_HEX,
     _INVITE_MAPPING,
     InstanceType,
     Intable,
@@ -232,7 +230,7 @@ class SteamID(metaclass=abc.ABCMeta):
         e.g. ``cv-dgb``.
         """
         if self.type == Type.Individual and self.is_valid():
-            invite_code = re.sub(f"[{_INVITE_HEX}]", lambda x: _INVITE_MAPPING[x.group()], f"{self.id:x}")
+            invite_code = f"{self.id:x}".translate(_INVITE_MAPPING)
             split_idx = len(invite_code) // 2
             return invite_code if split_idx == 0 else f"{invite_code[:split_idx]}-{invite_code[split_idx:]}"
 
@@ -482,11 +480,10 @@ class BaseUser(SteamID, Commentable):
         self.community_url = data.get("profileurl") or super().community_url
         self.avatar_url = data.get("avatarfull") or self.avatar_url
         self.trade_url = URL.COMMUNITY / f"tradeoffer/new/?partner={self.id}"
-        from .clan import Clan  # circular import
+        if "primaryclanid" in data:
+            from .clan import Clan  # circular import
 
-        self.primary_clan = (
-            Clan(self._state, data["primaryclanid"]) if "primaryclanid" in data else self.primary_clan  # type: ignore
-        )
+            self.primary_clan = Clan(self._state, data["primaryclanid"])  # type: ignore
         self.country = data.get("loccountrycode") or self.country
         self.created_at = datetime.utcfromtimestamp(data["timecreated"]) if "timecreated" in data else self.created_at
         self.last_logoff = datetime.utcfromtimestamp(data["lastlogoff"]) if "lastlogoff" in data else self.last_logoff
@@ -51,6 +51,8 @@ if TYPE_CHECKING:
 
 __all__ = ("Clan",)
 
+_MEMBER_BLOCK_REGEX = re.compile(r'<div(?=[^>]*\bclass="[^"]*\bmember_block\b)[^>]*\bdata-miniprofile="(\d+)"')
+
 
 class Clan(SteamID, Commentable, utils.AsyncInit):
     """Represents a Steam clan.
@@ -201,26 +203,28 @@ class Clan(SteamID, Commentable, utils.AsyncInit):
             return
 
         for stat in stats.find_all("div", class_="groupstat"):
-            if "Founded" in stat.text:
-                text = stat.text.split("Founded")[1].strip()
-                if ", " not in stat.text:
+            stat_text = stat.text  # each .text access re-walks the element's children
+            if "Founded" in stat_text:
+                text = stat_text.split("Founded")[1].strip()
+                if ", " not in stat_text:
                     text = f"{text}, {datetime.utcnow().year}"
                 try:
                     self.created_at = datetime.strptime(text, "%d %B, %Y" if text.split()[0].isdigit() else "%B %d, %Y")
                 except ValueError:  # why do other countries have to exist
                     self.created_at = None
-            if "Language" in stat.text:
-                self.language = stat.text.split("Language")[1].strip()
-            if "Location" in stat.text:
-                self.location = stat.text.split("Location")[1].strip()
+            elif "Language" in stat_text:
+                self.language = stat_text.split("Language")[1].strip()
+            elif "Location" in stat_text:
+                self.location = stat_text.split("Location")[1].strip()
 
         for count in stats.find_all("div", class_="membercount"):
-            if "MEMBERS" in count.text:
-                self.member_count = int(count.text.split("MEMBERS")[0].strip().replace(",", ""))
-            if "IN-GAME" in count.text:
-                self.in_game_count = int(count.text.split("IN-GAME")[0].strip().replace(",", ""))
-            if "ONLINE" in count.text:
-                self.online_count = int(count.text.split("ONLINE")[0].strip().replace(",", ""))
+            count_text = count.text
+            if "MEMBERS" in count_text:
+                self.member_count = int(count_text.split("MEMBERS")[0].strip().replace(",", ""))
+            elif "IN-GAME" in count_text:
+                self.in_game_count = int(count_text.split("IN-GAME")[0].strip().replace(",", ""))
+            elif "ONLINE" in count_text:
+                self.online_count = int(count_text.split("ONLINE")[0].strip().replace(",", ""))
 
         admins = []
         mods = []
@@ -355,31 +359,32 @@ class Clan(SteamID, Commentable, utils.AsyncInit):
         This can be a very slow operation due to the rate limits on this endpoint.
         """
 
-        def process(resp: str) -> BeautifulSoup:
-            soup = BeautifulSoup(resp, "html.parser")
-            for s in soup.find_all("div", id="memberList"):
-                for user in s.find_all("div", class_="member_block"):
-                    ret.append(SteamID(user["data-miniprofile"]))
-
-            return soup
+        def process(resp: str, page: list[SteamID]) -> None:
+            # the member blocks are all that's needed from each page, so skip building a soup for them
+            member_list = resp.find('id="memberList"')
+            if member_list != -1:
+                page += [SteamID(account_id) for account_id in _MEMBER_BLOCK_REGEX.findall(resp, member_list)]
 
         async def getter(i: int) -> None:
-            try:
-                resp = await self._state.http.get(
-                    f"{self.community_url}/members", params={"p": i + 1, "content_only": "true"}
-                )
-            except HTTPException:
-                await asyncio.sleep(20)
-                await getter(i)
-            else:
-                process(resp)
+            while True:
+                try:
+                    resp = await self._state.http.get(
+                        f"{self.community_url}/members", params={"p": i + 1, "content_only": "true"}
+                    )
+                except HTTPException:
+                    await asyncio.sleep(20)
+                else:
+                    process(resp, pages[i])
+                    return
 
-        ret = []
         resp = await self._state.http.get(f"{self.community_url}/members", params={"p": 1, "content_only": "true"})
-        soup = process(resp)
-        number_of_pages = int(re.findall(r"\d* - (\d*)", soup.find("div", class_="group_paging").text)[0])
+        first_page: list[SteamID] = []
+        process(resp, first_page)
+        paging = BeautifulSoup(resp, "html.parser").find("div", class_="group_paging")
+        number_of_pages = int(re.findall(r"\d* - (\d*)", paging.text)[0])
+        pages = [first_page, *([] for _ in range(1, number_of_pages))]  # pages finish in any order
         await asyncio.gather(*(getter(i) for i in range(1, number_of_pages)))
-        return ret
+        return [steam_id for page in pages for steam_id in page]
 
     @property
     def description(self) -> str:
@@ -277,7 +277,7 @@ class Client:
         )
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
-        log.debug(f"Dispatching event {event}")
+        log.debug("Dispatching event %s", event)
         method = f"on_{event}"
 
         listeners = self._listeners.get(event)
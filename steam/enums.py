@@ -28,7 +28,7 @@ EnumMeta originally from https://github.com/Rapptz/discord.py/blob/master/discor
 from __future__ import annotations
 
 import builtins
-from collections.abc import Generator, Mapping
+from collections.abc import Iterator, Mapping
 from types import MappingProxyType
 from typing import TYPE_CHECKING, Any, Generic, NoReturn, TypeVar
 
@@ -62,20 +62,40 @@ E = TypeVar("E", bound="Enum", covariant=True)
 IE = TypeVar("IE", bound="IntEnum")
 
 
+_PLAIN_TYPES = frozenset((int, str, bytes, float, tuple, type(None)))
+
+
 def _is_descriptor(obj: object) -> bool:
     """Returns True if obj is a descriptor, False otherwise."""
+    if type(obj) in _PLAIN_TYPES:  # the overwhelmingly common case for enum members, skip probing the attributes
+        return False
     return hasattr(obj, "__get__") or hasattr(obj, "__set__") or hasattr(obj, "__delete__")
 
 
 class EnumMeta(type, Generic[E]):
     _value_map_: Mapping[Any, E]
     _member_map_: Mapping[str, E]
+    _unknown_map_: dict[Any, E]
+    _members_: tuple[E, ...]
+    _is_mixin_: bool
+    __members__: MappingProxyType[str, E]
 
     def __new__(mcs, name: str, bases: tuple[type, ...], attrs: dict[str, Any]) -> Self:
-        enum_class = super().__new__(mcs, name, bases, attrs)
-
         value_mapping: dict[Any, E] = {}
         member_mapping: dict[str, E] = {}
+        # the class level attributes go straight into the namespace, so only the members need setting afterwards
+        namespace = {
+            **attrs,
+            "_value_map_": value_mapping,
+            "_member_map_": member_mapping,
+            "_unknown_map_": {},
+            "__members__": MappingProxyType(member_mapping),
+            # resolve whether this is a mixin enum once here rather than for every member that gets created
+            "_is_mixin_": any(not isinstance(base, EnumMeta) for parent in bases for base in parent.__mro__[:-1]),
+        }
+        enum_class = super().__new__(mcs, name, bases, namespace)
+        set_attribute = super().__setattr__
+        new_member = enum_class.__new__
 
         for key, value in attrs.items():
             if key[0] == "_" or _is_descriptor(value):
@@ -83,30 +103,32 @@ class EnumMeta(type, Generic[E]):
 
             member = value_mapping.get(value)
             if member is None:
-                member = enum_class.__new__(enum_class, name=key, value=value)
+                member = new_member(enum_class, name=key, value=value)
                 value_mapping[value] = member
 
             member_mapping[key] = member
-            super().__setattr__(enum_class, key, member)
+            set_attribute(enum_class, key, member)
 
-        super().__setattr__(enum_class, "_value_map_", value_mapping)
-        super().__setattr__(enum_class, "_member_map_", member_mapping)
+        set_attribute(enum_class, "_members_", tuple(member_mapping.values()))
         return enum_class
 
     def __call__(cls: type[E], value: Any) -> E:
         try:
-            return cls._value_map_[value]
-        except (KeyError, TypeError):
+            member = cls._value_map_.get(value)
+        except TypeError:
+            member = None
+        if member is None:
             raise ValueError(f"{value!r} is not a valid {cls.__name__}")
+        return member
 
     def __repr__(cls) -> str:
         return f"<enum {cls.__name__!r}>"
 
-    def __iter__(cls: type[E]) -> Generator[E, None, None]:
-        yield from cls._member_map_.values()
+    def __iter__(cls: type[E]) -> Iterator[E]:
+        return iter(cls._members_)
 
-    def __reversed__(cls: type[E]) -> Generator[E, None, None]:
-        yield from reversed(tuple(cls._member_map_.values()))  # can remove tuple cast after 3.7
+    def __reversed__(cls: type[E]) -> Iterator[E]:
+        return reversed(cls._members_)
 
     def __len__(cls) -> int:
         return len(cls._member_map_)
@@ -121,32 +143,32 @@ class EnumMeta(type, Generic[E]):
         raise AttributeError(f"{cls.__name__}: cannot delete Enum members.")
 
     def __contains__(cls, member: object) -> bool:
+        if member.__class__ is cls:  # skip the isinstance checks for the common case
+            return member.name in cls._member_map_  # type: ignore
         if not isinstance(member, Enum):
             return NotImplemented
         return isinstance(member, cls) and member.name in cls._member_map_
 
-    @property
-    def __members__(cls: type[E]) -> MappingProxyType[str, E]:
-        return MappingProxyType(cls._member_map_)
-
 
 class Enum(metaclass=EnumMeta):
     """A general enumeration, emulates `enum.Enum`."""
 
     name: str
     value: Any
+    _str_: str
+    _repr_: str
 
     def __new__(cls, *, name: str, value: Any) -> Self:
         # N.B. this method is not ever called after enum creation as it is shadowed by EnumMeta.__call__ and is just
         # for creating Enum members
         super_ = super()
-        self = (
-            super_.__new__(cls, value)
-            if any(not issubclass(base, Enum) for base in cls.__mro__[:-1])  # is it is a mixin enum
-            else super_.__new__(cls)
-        )
-        super_.__setattr__(self, "name", name)
-        super_.__setattr__(self, "value", value)
+        self = super_.__new__(cls, value) if cls._is_mixin_ else super_.__new__(cls)
+        set_attribute = super_.__setattr__
+        set_attribute(self, "name", name)
+        set_attribute(self, "value", value)
+        # members are immutable so their string forms can be computed once up front
+        set_attribute(self, "_str_", f"{cls.__name__}.{name}")
+        set_attribute(self, "_repr_", f"<{cls.__name__}.{name}: {value!r}>")
         return self
 
     def __setattr__(self, key: str, value: Any) -> NoReturn:
@@ -159,16 +181,28 @@ class Enum(metaclass=EnumMeta):
         return True  # an enum member with a zero value would return False otherwise
 
     def __str__(self) -> str:
-        return f"{self.__class__.__name__}.{self.name}"
+        return self._str_
 
     def __repr__(self) -> str:
-        return f"<{self.__class__.__name__}.{self.name}: {self.value!r}>"
+        return self._repr_
 
     @classmethod
     def try_value(cls: type[Self], value: Any) -> Self:
         try:
-            return cls._value_map_[value]
-        except (KeyError, TypeError):
+            member = cls._value_map_.get(value)  # avoids raising KeyError for unknown values
+        except TypeError:
+            member = None
+        return cls._from_unknown_value(value) if member is None else member
+
+    @classmethod
+    def _from_unknown_value(cls: type[Self], value: Any) -> Self:
+        # unknown values are interned so repeatedly receiving the same one doesn't create a new member each time
+        try:
+            return cls._unknown_map_[value]
+        except KeyError:
+            member = cls._unknown_map_[value] = cls.__new__(cls, name=f"{cls.__name__}UnknownValue", value=value)
+            return member
+        except TypeError:  # unhashable, so it can't be cached
             return cls.__new__(cls, name=f"{cls.__name__}UnknownValue", value=value)
 
 
@@ -198,14 +232,23 @@ if TYPE_CHECKING:
 class Flags(IntEnum):
     @classmethod
     def try_value(cls, value: int) -> Self:
+        # flags are only ever received from a handful of combinations so check what's already been built first
+        try:
+            member = cls._value_map_.get(value) or cls._unknown_map_.get(value)
+        except TypeError:
+            member = None
+        if member is not None:
+            return member
+
         flags = [enum for enum in cls if enum.value & value]
         if flags:
             returning_flag = flags[0]
             for flag in flags[1:]:
                 returning_flag |= flag
             if returning_flag == value:
+                cls._unknown_map_[value] = returning_flag
                 return returning_flag
-        return cls.__new__(cls, name=f"{cls.__name__}UnknownValue", value=value)
+        return cls._from_unknown_value(value)
 
     def __or__(self, other: Self | int) -> Self:
         cls = self.__class__
@@ -25,10 +25,9 @@ SOFTWARE.
 from __future__ import annotations
 
 import re
+from html.parser import HTMLParser
 from typing import TYPE_CHECKING, Any
 
-from bs4 import BeautifulSoup
-
 from .enums import Result
 
 if TYPE_CHECKING:
@@ -57,6 +56,31 @@ __all__ = (
 CODE_FINDER = re.compile(r"\S(\d+)\S")
 
 
+class _TextExtractor(HTMLParser):
+    # the same output as BeautifulSoup(html, "html.parser").get_text("\n") without building a tree
+    def __init__(self):
+        super().__init__()
+        self.parts: list[str] = []
+        self.in_script = False
+
+    def handle_starttag(self, tag: str, attrs: Any) -> None:
+        self.in_script = tag in ("script", "style")
+
+    def handle_endtag(self, tag: str) -> None:
+        self.in_script = False
+
+    def handle_data(self, data: str) -> None:
+        if not self.in_script:
+            self.parts.append(data)
+
+    @classmethod
+    def get_text(cls, html: str) -> str:
+        self = cls()
+        self.feed(html)
+        self.close()
+        return "\n".join(self.parts)
+
+
 class SteamException(Exception):
     """Base exception class for steam.py."""
 
@@ -112,8 +136,7 @@ class HTTPException(SteamException):
                         code = code[0]
                     self.code = Result.try_value(int(code))
             else:
-                text = BeautifulSoup(data, "html.parser").get_text("\n")
-                self.message = text or ""
+                self.message = _TextExtractor.get_text(data)
         else:
             self.message = ""
 
@@ -42,7 +42,7 @@ from typing import TYPE_CHECKING, Any, TypeVar
 from typing_extensions import Literal, TypeAlias, overload
 
 from ... import utils
-from ...client import Client, E, EventType, log
+from ...client import Client, E, EventType
 from .cog import Cog
 from .commands import CHR, CheckReturnType, CheckType, Command, GroupMixin, InvokeT, check
 from .context import Context
@@ -76,6 +76,8 @@ CommandPrefixType: TypeAlias = (
 )
 C = TypeVar("C", bound="Context")
 Check = TypeVar("Check", bound="Callable[[CheckType], CheckReturnType]")
+_CONVERTERS_PROXY = MappingProxyType(CONVERTERS)
+_EVENT_METHOD_NAMES: dict[str, str] = {}  # event -> on_event, saves formatting (and rehashing) the name every dispatch
 
 
 def when_mentioned(bot: Bot, message: Message) -> list[str]:
@@ -112,11 +114,25 @@ def when_mentioned_or(*prefixes: str) -> Callable[[Bot, Message], list[str]]:
     """
 
     def inner(bot: Bot, message: Message) -> list[str]:
-        return list(prefixes) + when_mentioned(bot, message)
+        return [*prefixes, bot.user.mention]  # equivalent to list(prefixes) + when_mentioned() in one allocation
 
     return inner
 
 
+def _resolve_prefixes(prefixes: StrOrIterStr) -> str | tuple[str, ...]:
+    if isinstance(prefixes, str):
+        return prefixes  # the common case, left as is so it can be matched without a loop
+
+    try:
+        resolved = tuple(prefixes)
+        for prefix in resolved:
+            if not isinstance(prefix, str):
+                raise TypeError(f"command_prefix must return an iterable of strings not {type(prefix)}")
+    except TypeError as exc:
+        raise TypeError(f"command_prefix must return an iterable of strings not {type(prefixes)}") from exc
+    return resolved
+
+
 def resolve_path(path: Path) -> str:
     return path.resolve().relative_to(Path.cwd()).with_suffix("").as_posix().replace("/", ".")
     # resolve cogs relative to where they are loaded as it's probably the most common use case for this
@@ -167,8 +183,11 @@ class Bot(GroupMixin, Client):
     ):
         super().__init__(**options)
         self.__cogs__: dict[str, Cog] = {}
-        self.__listeners__: dict[str, list[EventType]] = {}
+        self.__listeners__: dict[str, tuple[EventType, ...]] = {}
         self.__extensions__: dict[str, ModuleType] = {}
+        # proxies are live views of the underlying dicts so they only need creating once
+        self._cogs_proxy = MappingProxyType(self.__cogs__)
+        self._extensions_proxy = MappingProxyType(self.__extensions__)
 
         self.command_prefix = command_prefix
         self.owner_id = utils.make_id64(options.get("owner_id", 0))
@@ -176,19 +195,19 @@ class Bot(GroupMixin, Client):
         if self.owner_id and self.owner_ids:
             raise ValueError("You cannot have both owner_id and owner_ids")
 
-        for member in dir(self):
-            try:
-                command = getattr(self, member)
-            except AttributeError:
-                continue
-            if isinstance(command, Coroutine):
-                command.close()  # prevent RuntimeWarnings
-            elif isinstance(command, Command):
-                command.cog = self
-
-                if isinstance(command, GroupMixin):
+        # walk the class dicts directly rather than getattr-ing everything, which would evaluate every property
+        seen: set[str] = set()
+        for cls in self.__class__.__mro__:
+            for name, command in cls.__dict__.items():
+                if name in seen:
                     continue
-                self.add_command(command)
+                seen.add(name)
+                if isinstance(command, Command):
+                    command.cog = self
+
+                    if isinstance(command, GroupMixin):
+                        continue
+                    self.add_command(command)
 
         self.help_command = help_command
 
@@ -196,20 +215,35 @@ class Bot(GroupMixin, Client):
         self._before_hook = None
         self._after_hook = None
 
+    @property
+    def command_prefix(self) -> CommandPrefixType:
+        """What the message content must initially contain to have a command invoked."""
+        return self._command_prefix
+
+    @command_prefix.setter
+    def command_prefix(self, value: CommandPrefixType) -> None:
+        self._command_prefix = value
+        if callable(value):
+            self._prefixes = None  # these have to be resolved for every message
+        else:
+            prefixes = _resolve_prefixes(value)  # validate eagerly
+            # only immutable prefixes can be frozen, other iterables could be mutated in place later
+            self._prefixes = prefixes if isinstance(value, (str, tuple)) else None
+
     @property
     def cogs(self) -> MappingProxyType[str, Cog]:
         """A read only mapping of any loaded cogs."""
-        return MappingProxyType(self.__cogs__)
+        return self._cogs_proxy
 
     @property
     def extensions(self) -> MappingProxyType[str, ModuleType]:
         """A read only mapping of any loaded extensions."""
-        return MappingProxyType(self.__extensions__)
+        return self._extensions_proxy
 
     @property
     def converters(self) -> MappingProxyType[type, tuple[Converters, ...]]:
         """A read only mapping of registered converters."""
-        return MappingProxyType(CONVERTERS)
+        return _CONVERTERS_PROXY
 
     @property
     def help_command(self) -> HelpCommand | None:
@@ -230,20 +264,23 @@ class Bot(GroupMixin, Client):
 
     def dispatch(self, event: str, *args: Any, **kwargs: Any) -> None:
         super().dispatch(event, *args, **kwargs)
-        method = f"on_{event}"
-        for ev in self.__listeners__.get(method, []):
-            log.debug(f"Dispatching event {event}")
+        try:
+            method = _EVENT_METHOD_NAMES[event]
+        except KeyError:
+            method = _EVENT_METHOD_NAMES[event] = f"on_{event}"
+
+        for ev in self.__listeners__.get(method, ()):
             self._schedule_event(ev, method, *args, **kwargs)
 
     async def close(self) -> None:
         """Unloads any extensions and cogs, then closes the connection to Steam."""
-        for extension in tuple(self.extensions):
+        for extension in tuple(self.__extensions__):
             try:
                 self.unload_extension(extension)
             except Exception:
                 pass
 
-        for cog in tuple(self.cogs.values()):
+        for cog in tuple(self.__cogs__.values()):
             try:
                 self.remove_cog(cog)
             except Exception:
@@ -273,7 +310,7 @@ class Bot(GroupMixin, Client):
 
         module = importlib.import_module(name)
         if not hasattr(module, "setup"):
-            del sys.modules[name]
+            sys.modules.pop(name, None)
             raise ImportError(f"{extension!r} is missing a setup function", name=name, path=extension)
 
         module.setup(self)  # type: ignore
@@ -302,14 +339,14 @@ class Bot(GroupMixin, Client):
         except KeyError:
             raise ModuleNotFoundError(f"The extension {extension!r} was not found", name=name, path=extension) from None
 
-        for cog in tuple(self.cogs.values()):
+        for cog in tuple(self.__cogs__.values()):
             if cog.__module__ == module.__name__:
                 self.remove_cog(cog)
 
         if hasattr(module, "teardown"):
             module.teardown(self)
 
-        del sys.modules[name]
+        sys.modules.pop(name, None)  # the module may have already been removed by the extension
         del self.__extensions__[name]
 
     def reload_extension(self, extension: str | os.PathLike[str]) -> None:
@@ -337,8 +374,9 @@ class Bot(GroupMixin, Client):
             raise ModuleNotFoundError(f"The extension {extension!r} was not found", name=name, path=extension) from None
 
         try:
-            self.unload_extension(extension)
-            self.load_extension(extension)
+            # pass the already resolved name along so the path isn't resolved against the filesystem again
+            self.unload_extension(name)
+            self.load_extension(name)
         except:
             previous.setup(self)  # type: ignore
             self.__extensions__[name] = previous
@@ -385,10 +423,8 @@ class Bot(GroupMixin, Client):
         if not inspect.iscoroutinefunction(func):
             raise TypeError(f"Listeners must be coroutines, {name} is {type(func).__name__}")
 
-        try:
-            self.__listeners__[name].append(func)
-        except KeyError:
-            self.__listeners__[name] = [func]
+        # listeners are stored as tuples that get replaced rather than mutated, so dispatch can iterate them safely
+        self.__listeners__[name] = (*self.__listeners__.get(name, ()), func)
 
     def remove_listener(self, func: EventType, name: str | None = None) -> None:
         """Remove a function from the internal listeners list.
@@ -402,10 +438,12 @@ class Bot(GroupMixin, Client):
         """
         name = name or func.__name__
 
+        listeners = self.__listeners__.get(name, ())
         try:
-            self.__listeners__[name].remove(func)
-        except (KeyError, ValueError):
-            pass
+            idx = listeners.index(func)
+        except ValueError:
+            return
+        self.__listeners__[name] = listeners[:idx] + listeners[idx + 1 :]
 
     @overload
     def listen(self, coro: E) -> E:
@@ -438,7 +476,7 @@ class Bot(GroupMixin, Client):
 
         def decorator(predicate: Check) -> CHR:
             predicate = check(predicate)
-            self.add_check(predicate)
+            self.add_check(predicate.predicate)  # the normalised coroutine function, not the command decorator
             return predicate
 
         return decorator(predicate) if predicate is not None else decorator
@@ -459,12 +497,15 @@ class Bot(GroupMixin, Client):
         Parameters
         ----------
         predicate
-            The check to remove.
+            The check to remove, this can also be the value returned by :meth:`check`.
         """
-        try:
-            self.checks.remove(predicate)
-        except ValueError:
-            pass
+        # Bot.check registers the decorator's normalised predicate rather than the decorator itself
+        for check in (predicate, getattr(predicate, "predicate", None)):
+            try:
+                self.checks.remove(check)
+            except ValueError:
+                continue
+            return
 
     async def can_run(self, ctx: Context) -> bool:
         """Whether or not the context's command can be ran.
@@ -538,9 +579,20 @@ class Bot(GroupMixin, Client):
         message
             The message to get the context for.
         """
-        if message.author != self.user:
-            ctx = await self.get_context(message)
-            await self.invoke(ctx)
+        if message.author == self.user:
+            return
+
+        prefixes = self._prefixes
+        if (
+            prefixes is not None
+            and self.__class__.get_prefix is Bot.get_prefix
+            and self.__class__.get_context is Bot.get_context
+            and not message.content.startswith(prefixes)
+        ):
+            return  # this can't be a command, so don't bother building a context for it
+
+        ctx = await self.get_context(message)
+        await self.invoke(ctx)
 
     async def invoke(self, ctx: Context) -> None:
         """Invoke a command. This will parse arguments, checks, cooldowns etc. correctly.
@@ -550,10 +602,11 @@ class Bot(GroupMixin, Client):
         ctx
             The invocation context.
         """
-        if ctx.command is not None:
+        command = ctx.command
+        if command is not None:
             self.dispatch("command", ctx)
             try:
-                await ctx.command.invoke(ctx)
+                await command.invoke(ctx)
             except Exception as exc:
                 self.dispatch("command_error", ctx, exc)
             else:
@@ -579,7 +632,7 @@ class Bot(GroupMixin, Client):
 
         lex.position = len(prefix)
         invoked_with = lex.read()
-        command = self.__commands__.get(invoked_with)
+        command = self.__commands__.get(invoked_with) if invoked_with is not None else None
 
         return cls(
             bot=self,
@@ -598,20 +651,23 @@ class Bot(GroupMixin, Client):
         message
             The message to get the prefix for.
         """
-        prefixes = self.command_prefix
-        if callable(prefixes):
-            prefixes = await utils.maybe_coroutine(prefixes, self, message)
+        prefixes = self._prefixes
+        if prefixes is None:
+            command_prefix = self.command_prefix
+            prefixes = _resolve_prefixes(
+                await utils.maybe_coroutine(command_prefix, self, message)
+                if callable(command_prefix)
+                else command_prefix
+            )
+
+        content = message.content
+        if not content.startswith(prefixes):  # checks all of them in one go for the common case of no match
+            return None
         if isinstance(prefixes, str):
-            prefixes = (prefixes,)
-
-        try:
-            for prefix in prefixes:
-                if not isinstance(prefix, str):
-                    raise TypeError(f"command_prefix must return an iterable of strings not {type(prefix)}")
-                if message.content.startswith(prefix):
-                    return prefix
-        except TypeError as exc:
-            raise TypeError(f"command_prefix must return an iterable of strings not {type(prefixes)}") from exc
+            return prefixes
+        for prefix in prefixes:
+            if content.startswith(prefix):
+                return prefix
 
     def get_cog(self, name: str) -> Cog | None:
         """Get a loaded cog or ``None``.
@@ -637,13 +693,15 @@ class Bot(GroupMixin, Client):
         if self.__listeners__.get("on_command_error"):
             return
 
-        if hasattr(ctx.command, "on_error"):
-            return await ctx.command.on_error(ctx, error)
+        command = ctx.command
+        if hasattr(command, "on_error"):
+            return await command.on_error(ctx, error)
 
-        if ctx.cog and ctx.cog is not self:
-            return await ctx.cog.cog_command_error(ctx, error)
+        cog = ctx.cog
+        if cog and cog is not self:
+            return await cog.cog_command_error(ctx, error)
 
-        print(f"Ignoring exception in command {ctx.command}:", file=sys.stderr)
+        print(f"Ignoring exception in command {command}:", file=sys.stderr)
         traceback.print_exception(type(error), error, error.__traceback__, file=sys.stderr)
 
     if TYPE_CHECKING or utils.DOCS_BUILDING:
@@ -220,6 +220,7 @@ class Cog:
             if isinstance(command, Group):
                 for child in command.children:
                     del child.clean_params
+                    child.__dict__.pop("_parsers", None)
                     child.cog = self
                     child.clean_params
 
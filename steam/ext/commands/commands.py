@@ -82,6 +82,11 @@ CHR = TypeVar("CHR", bound="CheckReturnType")
 
 P = ParamSpec("P")
 
+POSITIONAL_OR_KEYWORD = inspect.Parameter.POSITIONAL_OR_KEYWORD
+KEYWORD_ONLY = inspect.Parameter.KEYWORD_ONLY
+VAR_KEYWORD = inspect.Parameter.VAR_KEYWORD
+VAR_POSITIONAL = inspect.Parameter.VAR_POSITIONAL
+
 
 class CommandDeco(Protocol):
     def __call__(self, __command: MC) -> MC:
@@ -101,12 +106,16 @@ class CallbackType(Protocol[P]):
         ...
 
 
+TRUE_VALUES = frozenset(("yes", "y", "true", "t", "1", "enable", "on"))
+FALSE_VALUES = frozenset(("no", "n", "false", "f", "0", "disable", "off"))
+
+
 @converters.converter_for(bool)
 def to_bool(argument: str) -> bool:
     lowered = argument.lower()
-    if lowered in ("yes", "y", "true", "t", "1", "enable", "on"):
+    if lowered in TRUE_VALUES:
         return True
-    elif lowered in ("no", "n", "false", "f", "0", "disable", "off"):
+    elif lowered in FALSE_VALUES:
         return False
     raise BadArgument(f"{argument!r} is not a recognised boolean option")
 
@@ -191,13 +200,12 @@ class Command(Generic[P]):
         self.usage: str | None = kwargs.get("usage")
         self.cog: Cog | Bot | None = kwargs.get("cog")
         self.parent: GroupMixin | None = kwargs.get("parent")
-        self.description: str = inspect.cleandoc(kwargs.get("description", ""))
+        description = kwargs.get("description")
+        self.description: str = inspect.cleandoc(description) if description else ""
         self.hidden: bool = kwargs.get("hidden", False)
-        self.aliases: Iterable[str] = kwargs.get("aliases", ())
-
-        for alias in self.aliases:
-            if not isinstance(alias, str):
-                raise TypeError("A commands aliases should be an iterable only containing strings")
+        self.aliases: tuple[str, ...] = tuple(kwargs.get("aliases", ()))  # aliases could be a one-shot iterator
+        if not all(isinstance(alias, str) for alias in self.aliases):
+            raise TypeError("A commands aliases should be an iterable only containing strings")
 
         self._before_hook = None
         self._after_hook = None
@@ -412,11 +420,12 @@ class Command(Generic[P]):
         for check in self.checks:
             if not await maybe_coroutine(check, ctx):
                 return False
-        for cooldown in self.cooldown:
-            bucket = cooldown.bucket.get_bucket(ctx)
-            retry_after = cooldown.get_retry_after(bucket, time())
-            if retry_after:
-                return False
+        if self.cooldown:
+            now = time()  # judge every cooldown against the same instant
+            for cooldown in self.cooldown:
+                bucket = cooldown.bucket.get_bucket(ctx)
+                if cooldown.get_retry_after(bucket, now):
+                    return False
 
         return True
 
@@ -432,14 +441,16 @@ class Command(Generic[P]):
         if ctx.bot._after_hook is not None:
             await ctx.bot._after_hook(ctx)
 
-    async def _parse_positional_or_keyword_argument(self, ctx: Context, param: inspect.Parameter, args: list) -> None:
+    async def _parse_positional_or_keyword_argument(
+        self, ctx: Context, param: inspect.Parameter, converter: Any, args: list[Any], kwargs: dict[str, Any]
+    ) -> None:
         is_greedy = get_origin(param.annotation) is converters.Greedy
         greedy_args: list[Any] = []
         if ctx.lex.position == ctx.lex.end:
             args.append(await self._get_default(ctx, param))
         for argument in ctx.lex:
             try:
-                transformed = await self._transform(ctx, param, argument)
+                transformed = await self._convert(ctx, converter, param, argument)
             except BadArgument:
                 if not is_greedy:
                     raise
@@ -451,22 +462,22 @@ class Command(Generic[P]):
                 break
             greedy_args.append(transformed)
 
-    async def _parse_keyword_argument(self, ctx: Context, param: inspect.Parameter, kwargs: dict[str, Any]) -> None:
+    async def _parse_keyword_argument(
+        self, ctx: Context, param: inspect.Parameter, converter: Any, args: list[Any], kwargs: dict[str, Any]
+    ) -> None:
+        rest = ctx.lex.rest
         kwargs[param.name] = await (  # kwarg only param denotes "consume rest" semantics
-            self._transform(ctx, param, ctx.lex.rest) if ctx.lex.rest else self._get_default(ctx, param)
+            self._convert(ctx, converter, param, rest) if rest else self._get_default(ctx, param)
         )
 
-    async def _parse_var_keyword_argument(self, ctx: Context, param: inspect.Parameter, kwargs: dict[str, Any]) -> None:
-        kv_pairs = [arg.split("=") for arg in ctx.lex]
+    async def _parse_var_keyword_argument(
+        self, ctx: Context, param: inspect.Parameter, converter: Any, args: list[Any], kwargs: dict[str, Any]
+    ) -> None:
+        kv_pairs = [arg.split("=", 1) for arg in ctx.lex]  # values are allowed to contain "="
         if not kv_pairs:
             raise MissingRequiredArgument(param)  # defaults don't work here
 
-        key_type, value_type = (
-            (str, str) if param.annotation in (param.empty, dict) else get_args(param.annotation)
-        )  # default to dict[str, str]
-
-        key_converter = self._get_converter(key_type)
-        value_converter = self._get_converter(value_type)
+        key_converter, value_converter = converter
         try:
             for key_arg, value_arg in kv_pairs:
                 if key_arg in kwargs:
@@ -481,35 +492,52 @@ class Command(Generic[P]):
         except ValueError:
             raise UnmatchedKeyValuePair("Unmatched key-value pair passed") from None
 
-    async def _parse_var_position_argument(self, ctx: Context, param: inspect.Parameter, args: list) -> None:
+    async def _parse_var_position_argument(
+        self, ctx: Context, param: inspect.Parameter, converter: Any, args: list[Any], kwargs: dict[str, Any]
+    ) -> None:
         for arg in ctx.lex:
-            transformed = await self._transform(ctx, param, arg)
+            transformed = await self._convert(ctx, converter, param, arg)
             args.append(transformed)
 
     async def _parse_arguments(self, ctx: Context) -> None:
         args: list[Any] = []
         kwargs: dict[str, Any] = {}  # these are mutated by functions above
 
-        for param in self.clean_params.values():
-            if param.kind == param.POSITIONAL_OR_KEYWORD:
-                await self._parse_positional_or_keyword_argument(ctx, param, args)
-            elif param.kind == param.KEYWORD_ONLY:
-                await self._parse_keyword_argument(ctx, param, kwargs)
-                break
-            elif param.kind == param.VAR_KEYWORD:  # same as **kwargs
-                await self._parse_var_keyword_argument(ctx, param, kwargs)
-                break
-            elif param.kind == param.VAR_POSITIONAL:  # same as *args
-                await self._parse_var_position_argument(ctx, param, args)
-                break
+        for parse, param, param_type in self._parsers:
+            # converters are looked up per call so ones registered after the command was first used still apply
+            converter = (
+                tuple(self._get_converter(type_) for type_ in param_type)
+                if param.kind is VAR_KEYWORD
+                else self._get_converter(param_type)
+            )
+            await parse(ctx, param, converter, args, kwargs)
 
         ctx.args = tuple(args)
         ctx.kwargs = kwargs
 
-    def _transform(self, ctx: Context, param: inspect.Parameter, argument: str) -> Coroutine[None, None, Any]:
-        parm_type = self._prepare_param(param)
-        converter = self._get_converter(parm_type)
-        return self._convert(ctx, converter, param, argument)
+    @cached_property
+    def _parsers(self) -> tuple[tuple[Callable[..., Coroutine[Any, Any, None]], inspect.Parameter, Any], ...]:
+        # work out which parser and type each parameter needs once, rather than on every invocation
+        parsers: list[tuple[Callable[..., Coroutine[Any, Any, None]], inspect.Parameter, Any]] = []
+        for param in self.clean_params.values():
+            kind = param.kind
+            if kind is VAR_KEYWORD:  # same as **kwargs
+                types = (
+                    (str, str) if param.annotation in (param.empty, dict) else get_args(param.annotation)
+                )  # default to dict[str, str]
+                parsers.append((self._parse_var_keyword_argument, param, types))
+                break
+
+            param_type = self._prepare_param(param)
+            if kind is POSITIONAL_OR_KEYWORD:
+                parsers.append((self._parse_positional_or_keyword_argument, param, param_type))
+            elif kind is KEYWORD_ONLY:
+                parsers.append((self._parse_keyword_argument, param, param_type))
+                break
+            elif kind is VAR_POSITIONAL:  # same as *args
+                parsers.append((self._parse_var_position_argument, param, param_type))
+                break
+        return tuple(parsers)
 
     def _prepare_param(self, param: inspect.Parameter) -> type:
         converter = param.annotation
@@ -542,7 +570,8 @@ class Command(Generic[P]):
         param: inspect.Parameter,
         argument: str,
     ) -> Any:
-        if isinstance(converter, converters.ConverterBase):
+        # the same check as isinstance(converter, converters.ConverterBase), without the cost of a runtime protocol check
+        if getattr(converter, "convert", None) is not None:
             if isinstance(converter, type):  # needs to be instantiated
                 converter = converter()
             try:
@@ -616,6 +645,8 @@ class GroupMixin:
     def __init__(self, *args: Any, **kwargs: Any):
         self.case_insensitive: bool = kwargs.get("case_insensitive", False)
         self.__commands__: dict[str, Command] = CaseInsensitiveDict() if self.case_insensitive else {}
+        self._commands: set[Command] = set()  # __commands__ without the aliases
+        self._commands_view: frozenset[Command] | None = frozenset()  # cleared whenever _commands changes
         super().__init__(*args, **kwargs)
 
     @property
@@ -624,9 +655,11 @@ class GroupMixin:
         return list(self.__commands__.values())
 
     @property
-    def commands(self) -> set[Command]:
-        """A set of the loaded commands without duplicates."""
-        return set(self.__commands__.values())
+    def commands(self) -> frozenset[Command]:
+        """A read-only set of the loaded commands without duplicates."""
+        if self._commands_view is None:
+            self._commands_view = frozenset(self._commands)
+        return self._commands_view
 
     def add_command(self, command: Command) -> None:
         """Add a command to the internal commands list.
@@ -648,12 +681,18 @@ class GroupMixin:
                     f"Please rename the parameter {param.name} or make its annotation defined at runtime"
                 )
 
+        names = self.__commands__.__class__()  # keys are normalised the same way as __commands__
+        names[command.name] = None
+        for alias in command.aliases:  # validate everything before registering anything
+            if alias in names or alias in self.__commands__:
+                raise ClientException(f"{alias} is already an existing command or alias.")
+            names[alias] = None
+
         self.__commands__[command.name] = command
         for alias in command.aliases:
-            if alias in self.__commands__:
-                self.remove_command(command.name)
-                raise ClientException(f"{alias} is already an existing command or alias.")
             self.__commands__[alias] = command
+        self._commands.add(command)
+        self._commands_view = None
 
     def remove_command(self, name: str) -> Command | None:
         """Remove a command from the internal commands list.
@@ -669,11 +708,13 @@ class GroupMixin:
         """
         try:
             command = self.__commands__.pop(name)
-        except ValueError:
+        except KeyError:
             return None
 
         for alias in command.aliases:
             del self.__commands__[alias]
+        self._commands.discard(command)
+        self._commands_view = None
         return command
 
     def get_command(self, name: str) -> Command | None:
@@ -852,15 +893,20 @@ class GroupMixin:
         :class:`list`\\[:class:`Command`]
         """
         commands = []
-        for command in self.commands:
-            commands.append(command)
-            if isinstance(command, Group):
-                commands.extend(command.children)
+        stack = [iter(self.commands)]  # walk depth first without recursing into each group's children
+        while stack:
+            for command in stack[-1]:
+                commands.append(command)
+                if isinstance(command, Group):
+                    stack.append(iter(command.commands))
+                    break
+            else:
+                stack.pop()
 
         return commands
 
     def recursively_remove_all_commands(self) -> None:
-        for command in self.commands:
+        for command in tuple(self._commands):  # snapshot it as remove_command mutates it
             if isinstance(command, GroupMixin):
                 command.recursively_remove_all_commands()
             self.remove_command(command.name)
@@ -1082,9 +1128,9 @@ def is_owner(command: MCD | None = None) -> MCD:
     """
 
     def predicate(ctx: Context) -> bool:
-        if ctx.bot.owner_id and ctx.author.id64 == ctx.bot.owner_id:
-            return True
-        if ctx.bot.owner_ids and ctx.author.id64 in ctx.bot.owner_ids:
+        bot = ctx.bot
+        id64 = ctx.author.id64  # owner_id is 0 if it isn't set, which is never a valid id64
+        if id64 == bot.owner_id or id64 in bot.owner_ids:
             return True
         raise NotOwner()
 
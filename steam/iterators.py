@@ -338,7 +338,7 @@ class TradesIterator(AsyncIterator["TradeOffer"]):
         super().__init__(state, limit, before, after)
 
     async def fill(self) -> None:
-        from .trade import TradeOffer
+        from .trade import TradeOffer, _add_descriptions, _index_descriptions
 
         resp = await self._state.http.get_trade_history(100, None)
         resp = resp["response"]
@@ -346,23 +346,18 @@ class TradesIterator(AsyncIterator["TradeOffer"]):
         if not total:
             return
 
-        descriptions = resp.get("descriptions", [])
+        descriptions = _index_descriptions(resp.get("descriptions", []))
         after_timestamp = self.after.timestamp()
         before_timestamp = self.before.timestamp()
 
         class Stop(Exception):
             ...
 
-        async def process_trade(data: dict[str, Any], descriptions: list[DescriptionDict]) -> None:
+        async def process_trade(data: dict[str, Any], descriptions: dict[tuple[str, str], DescriptionDict]) -> None:
             if not after_timestamp < data["time_init"] < before_timestamp:
                 return
-            for item in descriptions:
-                for asset in data.get("assets_received", []):
-                    if item["classid"] == asset["classid"] and item["instanceid"] == asset["instanceid"]:
-                        asset.update(item)
-                for asset in data.get("assets_given", []):
-                    if item["classid"] == asset["classid"] and item["instanceid"] == asset["instanceid"]:
-                        asset.update(item)
+            _add_descriptions(data.get("assets_received", []), descriptions)
+            _add_descriptions(data.get("assets_given", []), descriptions)
 
             # patch in the attributes cause steam is cool
             data["tradeofferid"] = data["tradeid"]
@@ -71,7 +71,7 @@ from .protobufs import (
     player,
     struct_messages,
 )
-from .trade import DescriptionDict, TradeOffer, TradeOfferDict
+from .trade import DescriptionDict, TradeOffer, TradeOfferDict, _add_descriptions, _index_descriptions
 from .user import User
 
 if TYPE_CHECKING:
@@ -297,14 +297,10 @@ class ConnectionState(Registerable):
         self, trades: list[TradeOfferDict], descriptions: list[DescriptionDict]
     ) -> list[TradeOffer]:
         ret = []
+        index = _index_descriptions(descriptions)
         for trade in trades:
-            for item in descriptions:
-                for asset in trade.get("items_to_receive", ()):
-                    if item["classid"] == asset["classid"] and item["instanceid"] == asset["instanceid"]:
-                        asset.update(item)
-                for asset in trade.get("items_to_give", ()):
-                    if item["classid"] == asset["classid"] and item["instanceid"] == asset["instanceid"]:
-                        asset.update(item)
+            _add_descriptions(trade.get("items_to_receive", ()), index)
+            _add_descriptions(trade.get("items_to_give", ()), index)
             ret.append(await self._store_trade(trade))
         return ret
 
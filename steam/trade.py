@@ -26,10 +26,13 @@ from __future__ import annotations
 
 import asyncio
 import dis
+import inspect
 import sys
 import types
+import weakref
 from collections.abc import Iterator, Sequence
 from datetime import datetime, timedelta
+from time import time
 from typing import TYPE_CHECKING, Any, Generic, NamedTuple, TypeVar
 
 from typing_extensions import NotRequired, Required, TypeAlias, TypedDict
@@ -142,6 +145,22 @@ class TradeOfferReceiptDict(TypedDict):
     descriptions: list[DescriptionDict]
 
 
+def _index_descriptions(descriptions: list[DescriptionDict]) -> dict[tuple[str, str], DescriptionDict]:
+    # map each description to its (instance id, class id) so matching up assets is a dict lookup per asset
+    index: dict[tuple[str, str], DescriptionDict] = {}
+    for description in descriptions:
+        index.setdefault((description["instanceid"], description["classid"]), description)
+    return index
+
+
+def _add_descriptions(assets: list[AssetDict], descriptions: dict[tuple[str, str], DescriptionDict]) -> None:
+    # merge each asset with its description in place, descriptions should be from _index_descriptions
+    for asset in assets:
+        description = descriptions.get((asset["instanceid"], asset["classid"]))
+        if description is not None:
+            asset.update(description)  # type: ignore
+
+
 class Asset:
     """Base most version of an item. This class should only be received when Steam fails to find a matching item for
     its class and instance IDs.
@@ -152,6 +171,10 @@ class Asset:
 
             Checks if two assets are equal.
 
+        .. describe:: hash(x)
+
+            Returns the asset's hash.
+
     Attributes
     -------------
     asset_id
@@ -185,6 +208,9 @@ class Asset:
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Asset) and self.instance_id == other.instance_id and self.class_id == other.class_id
 
+    def __hash__(self) -> int:
+        return hash((self.class_id, self.instance_id))
+
     def to_dict(self) -> AssetToDict:
         return {
             "assetid": str(self.asset_id),
@@ -193,10 +219,15 @@ class Asset:
             "contextid": str(self.game.context_id),
         }
 
-    @utils.cached_slot_property
+    @property
     def game(self) -> StatefulGame:
         """The game the item is from."""
-        return StatefulGame(self._state, id=self._app_id)
+        # this is read for every asset in to_dict and repr so avoid cached_slot_property's pure python __get__
+        try:
+            return self._game_cs
+        except AttributeError:
+            self._game_cs = game = StatefulGame(self._state, id=self._app_id)
+            return game
 
     @property
     def _state(self) -> ConnectionState:
@@ -258,21 +289,22 @@ class Item(Asset):
         self._from_data(data)
 
     def _from_data(self, data: ItemDict) -> None:
-        self.name = data.get("market_name")
-        self.display_name = data.get("name")
-        self.colour = int(data["name_color"], 16) if "name_color" in data else None
-        self.descriptions = data.get("descriptions")
-        self.type = data.get("type")
-        self.tags = data.get("tags")
+        get = data.get
+        self.name = get("market_name")
+        self.display_name = get("name")
+        colour = get("name_color")
+        self.colour = int(colour, 16) if colour is not None else None
+        self.descriptions = get("descriptions")
+        self.type = get("type")
+        self.tags = get("tags")
+        icon_url = get("icon_url_large")
         self.icon_url = (
-            f'https://steamcommunity-a.akamaihd.net/economy/image/{data["icon_url_large"]}'
-            if "icon_url_large" in data
-            else None
+            f"https://steamcommunity-a.akamaihd.net/economy/image/{icon_url}" if icon_url is not None else None
         )
-        self.fraud_warnings = data.get("fraudwarnings", [])
-        self.actions = data.get("actions", [])
-        self._is_tradable = bool(data.get("tradable", False))
-        self._is_marketable = bool(data.get("marketable", False))
+        self.fraud_warnings = get("fraudwarnings", [])
+        self.actions = get("actions", [])
+        self._is_tradable = bool(get("tradable", False))
+        self._is_marketable = bool(get("marketable", False))
 
     def is_tradable(self) -> bool:
         """Whether the item is tradable."""
@@ -322,6 +354,10 @@ class InventoryGenericAlias(GenericAlias, **kwargs):
         return (BaseInventory,)
 
 
+# the aliases made by BaseInventory.__class_getitem__ for each code object, keyed by (cls, params, line number)
+_ALIASES: weakref.WeakKeyDictionary[types.CodeType, dict[Any, InventoryGenericAlias]] = weakref.WeakKeyDictionary()
+
+
 class BaseInventory(Generic[I]):
     """Base for all inventories."""
 
@@ -330,6 +366,8 @@ class BaseInventory(Generic[I]):
         "items",
         "owner",
         "_state",
+        "_item_keys",
+        "_items_by_name",
         "__orig_class__",  # undocumented typing internals more shim to make setting __class__ work
     )
 
@@ -355,7 +393,7 @@ class BaseInventory(Generic[I]):
             raise TypeError(
                 f"unsupported operand type(s) for 'in': {item.__class__.__qualname__!r} and {self.__class__.__name__!r}"
             )
-        return item in self.items
+        return (item.class_id, item.instance_id) in self._item_keys
 
     if not TYPE_CHECKING:
 
@@ -364,38 +402,58 @@ class BaseInventory(Generic[I]):
             # assigned name
 
             frame = sys._getframe(1)
+            code = frame.f_code
+            key = (cls, params, frame.f_lineno)
+            try:  # disassembling the caller is slow so only do it once per call site
+                return _ALIASES[code][key]
+            except (KeyError, TypeError):
+                pass
+
             generic_alias = InventoryGenericAlias(cls, params)
 
             on_line = False
             return_next = False
-            for instruction in dis.get_instructions(frame.f_code):
+            for instruction in dis.get_instructions(code):
                 if return_next and instruction.opname == "STORE_NAME":
+                    object.__setattr__(generic_alias, "__alias_name__", instruction.argval)
                     break
                 elif instruction.starts_line == frame.f_lineno:
                     on_line = True
                 elif on_line and instruction.opname == "BINARY_SUBSCR":
                     return_next = True
-            else:
-                return generic_alias
 
-            object.__setattr__(generic_alias, "__alias_name__", instruction.argval)
+            try:
+                _ALIASES.setdefault(code, {})[key] = generic_alias
+            except TypeError:  # unhashable params
+                pass
             return generic_alias
 
     def _update(self, data: InventoryDict) -> None:
         self.items: Sequence[I] = []
-        ItemClass: type[Item] = self.__orig_class__.__args__[0]
-        for asset in data.get("assets", ()):
-            for item in data["descriptions"]:
-                if item["instanceid"] == asset["instanceid"] and item["classid"] == asset["classid"]:
+        assets = data.get("assets")
+        if assets:  # empty inventories don't have any assets or descriptions so there's nothing to set up
+            ItemClass: type[Item] = self.__orig_class__.__args__[0]
+            # only build an intermediate Item for classes that wrap one, everything else can take the data directly
+            needs_wrap = "item" in inspect.signature(ItemClass).parameters
+            descriptions = _index_descriptions(data.get("descriptions", ()))
+            for asset in assets:
+                item = descriptions.get((asset["instanceid"], asset["classid"]))
+                if item is not None:
                     item.update(asset)
                     self.items.append(  # type: ignore
-                        ItemClass(item=Item(data=item, owner=self.owner)),
+                        ItemClass(item=Item(data=item, owner=self.owner))
+                        if needs_wrap
+                        else ItemClass(data=item, owner=self.owner),
                     )
-                    break
-            else:
-                self.items.append(  # type: ignore
-                    Asset(data=asset, owner=self.owner),
-                )
+                else:
+                    self.items.append(  # type: ignore
+                        Asset(data=asset, owner=self.owner),
+                    )
+        self._item_keys = frozenset((item.class_id, item.instance_id) for item in self.items)
+        self._items_by_name: dict[str, list[I]] = {}
+        for item in self.items:
+            if isinstance(item, Item):
+                self._items_by_name.setdefault(item.name, []).append(item)
 
     async def update(self) -> None:
         """Re-fetches the inventory."""
@@ -421,10 +479,12 @@ class BaseInventory(Generic[I]):
         ---------
         The matching items.
         """
-        if len(names) > 1 and limit:
-            raise ValueError("Cannot pass a limit with multiple items")
-        items = [item for item in self if item.name in names]
-        return items if limit is None else items[:limit]
+        if len(names) > 1:
+            if limit:
+                raise ValueError("Cannot pass a limit with multiple items")
+            return [item for item in self if isinstance(item, Item) and item.name in names]
+        items = self._items_by_name.get(names[0], []) if names else []
+        return items[:limit]
 
     def get_item(self, name: str) -> I | None:
         """A helper function that gets an item or ``None`` if no matching item is found by name from the inventory.
@@ -434,8 +494,8 @@ class BaseInventory(Generic[I]):
         name
             The item to get from the inventory.
         """
-        item = self.filter_items(name, limit=1)
-        return item[0] if item else None
+        items = self._items_by_name.get(name)
+        return items[0] if items else None
 
 
 Inventory: TypeAlias = BaseInventory[Item]  # necessitated by TypeVar not currently supporting defaults
@@ -500,6 +560,12 @@ class TradeOffer:
     """Represents a trade offer from/to send to a User.
     This can also be used in :meth:`steam.User.send`.
 
+    Note
+    ----
+    An offer that hasn't been sent is only equal to itself and is hashed by identity. Once it is sent it is compared
+    and hashed by its :attr:`id` instead, so its hash changes and it shouldn't be used as a set member or
+    :class:`dict` key until it has been sent.
+
     Parameters
     ----------
     item_to_send
@@ -519,43 +585,29 @@ class TradeOffer:
     ----------
     partner
         The trade offer partner. This should only ever be a :class:`~steam.SteamID` if the partner's profile is private.
-    items_to_send
-        A list of items to send to the partner.
-    items_to_receive
-        A list of items to receive from the partner.
     state
         The offer state of the trade for the possible types see :class:`~steam.TradeOfferState`.
     message
         The message included with the trade offer.
     id
         The trade's offer ID.
-    created_at
-        The time at which the trade was created.
-    updated_at
-        The time at which the trade was last updated.
-    expires
-        The time at which the trade automatically expires.
-    escrow
-        The time at which the escrow will end. Can be ``None`` if there is no escrow on the trade.
-
-        Warning
-        -------
-        This isn't likely to be accurate, use :meth:`User.escrow` instead if possible.
     """
 
     __slots__ = (
         "id",
         "_id",
         "state",
-        "escrow",
         "partner",
         "message",
         "token",
-        "expires",
-        "updated_at",
-        "created_at",
-        "items_to_send",
-        "items_to_receive",
+        "_escrow",
+        "_expires",
+        "_updated_at",
+        "_created_at",
+        "_items_to_send",
+        "_items_to_receive",
+        "_items_to_send_data",
+        "_items_to_receive_data",
         "_has_been_sent",
         "_state",
         "_is_our_offer",
@@ -571,8 +623,11 @@ class TradeOffer:
         items_to_send: list[Items] | None = None,
         items_to_receive: list[Items] | None = None,
     ):
-        self.items_to_receive: list[Items] = items_to_receive or []
-        self.items_to_send: list[Items] = items_to_send or []
+        # the raw items from the API, these are only turned into Items when they're first accessed
+        self._items_to_send_data: list[ItemDict] = []
+        self._items_to_receive_data: list[ItemDict] = []
+        self.items_to_receive = items_to_receive or []
+        self.items_to_send = items_to_send or []
         if item_to_receive:
             self.items_to_receive.append(item_to_receive)
         if item_to_send:
@@ -580,9 +635,11 @@ class TradeOffer:
         self.message: str | None = message or None
         self.token: str | None = token
         self.partner: User | SteamID | None = None
-        self.updated_at: datetime | None = None
-        self.created_at: datetime | None = None
-        self.escrow: timedelta | None = None
+        # raw timestamps, the datetimes are only built if they're accessed
+        self._escrow: int | None = None
+        self._expires: int | None = None
+        self._updated_at: int | None = None
+        self._created_at: float | None = None
         self.state = TradeOfferState.Invalid
         self._id: int | None = None
         self._has_been_sent = False
@@ -605,7 +662,7 @@ class TradeOffer:
         self._state = state
         self.partner = partner
         self.state = TradeOfferState.Active if active else TradeOfferState.ConfirmationNeed
-        self.created_at = datetime.utcnow()
+        self._created_at = time()
         self._is_our_offer = True
 
     def __repr__(self) -> str:
@@ -617,22 +674,83 @@ class TradeOffer:
         self.message = data.get("message") or None
         self.id = int(data["tradeofferid"])
         self._id = int(data["tradeid"]) if "tradeid" in data else None
-        expires = data.get("expiration_time")
-        escrow = data.get("escrow_end_date")
-        updated_at = data.get("time_updated")
-        created_at = data.get("time_created")
-        self.expires = datetime.utcfromtimestamp(expires) if expires else None
-        self.escrow = datetime.utcfromtimestamp(escrow) - datetime.utcnow() if escrow else None
-        self.updated_at = datetime.utcfromtimestamp(updated_at) if updated_at else None
-        self.created_at = datetime.utcfromtimestamp(created_at) if created_at else None
+        self._expires = data.get("expiration_time")
+        self._escrow = data.get("escrow_end_date")
+        self._updated_at = data.get("time_updated")
+        self._created_at = data.get("time_created")
         self.state = TradeOfferState.try_value(data.get("trade_offer_state", 1))
-        self.items_to_send = [Item(data=item, owner=self.partner) for item in data.get("items_to_give", [])]
-        self.items_to_receive = [Item(data=item, owner=self.partner) for item in data.get("items_to_receive", [])]
+        self._items_to_send_data = data.get("items_to_give", [])
+        self._items_to_receive_data = data.get("items_to_receive", [])
+        self._items_to_send = self._update_items(self._items_to_send, self._items_to_send_data)
+        self._items_to_receive = self._update_items(self._items_to_receive, self._items_to_receive_data)
         self._is_our_offer = data.get("is_our_offer", False)
 
+    @property
+    def created_at(self) -> datetime | None:
+        """The time at which the trade was created."""
+        return datetime.utcfromtimestamp(self._created_at) if self._created_at else None
+
+    @property
+    def updated_at(self) -> datetime | None:
+        """The time at which the trade was last updated."""
+        return datetime.utcfromtimestamp(self._updated_at) if self._updated_at else None
+
+    @property
+    def expires(self) -> datetime | None:
+        """The time at which the trade automatically expires."""
+        return datetime.utcfromtimestamp(self._expires) if self._expires else None
+
+    @property
+    def escrow(self) -> timedelta | None:
+        """The time until the escrow on the trade ends. Can be ``None`` if there is no escrow on the trade.
+
+        Warning
+        -------
+        This isn't likely to be accurate, use :meth:`User.escrow` instead if possible.
+        """
+        return datetime.utcfromtimestamp(self._escrow) - datetime.utcnow() if self._escrow else None
+
+    @property
+    def items_to_send(self) -> list[Items]:
+        """A list of items to send to the partner."""
+        if self._items_to_send is None:
+            self._items_to_send = [Item(data=item, owner=self.partner) for item in self._items_to_send_data]
+        return self._items_to_send
+
+    @items_to_send.setter
+    def items_to_send(self, items: list[Items]) -> None:
+        self._items_to_send = items
+
+    @property
+    def items_to_receive(self) -> list[Items]:
+        """A list of items to receive from the partner."""
+        if self._items_to_receive is None:
+            self._items_to_receive = [Item(data=item, owner=self.partner) for item in self._items_to_receive_data]
+        return self._items_to_receive
+
+    @items_to_receive.setter
+    def items_to_receive(self, items: list[Items]) -> None:
+        self._items_to_receive = items
+
+    def _update_items(self, items: list[Items] | None, data: list[ItemDict]) -> list[Items] | None:
+        # an offer's items can't change once it's been sent so reuse the ones we already have when the offer is polled
+        if not items:
+            return None  # they haven't been accessed yet
+        old_items = {(item.asset_id, item.instance_id, item.class_id): item for item in items if isinstance(item, Item)}
+        return [
+            old_items.get((int(item["assetid"]), int(item["instanceid"]), int(item["classid"])))
+            or Item(data=item, owner=self.partner)
+            for item in data
+        ]
+
     def __eq__(self, other: Any) -> bool:
+        if self is other:
+            return True
         return isinstance(other, TradeOffer) and self._has_been_sent and other._has_been_sent and self.id == other.id
 
+    def __hash__(self) -> int:
+        return hash(self.id) if self._has_been_sent else id(self)
+
     async def confirm(self) -> None:
         """Confirms the trade offer.
         This rarely needs to be called as the client handles most of these.
@@ -672,13 +790,16 @@ class TradeOffer:
         self._check_active()
         resp = await self._state.http.accept_user_trade(self.partner.id64, self.id)
         if resp.get("needs_mobile_confirmation", False):
-            for tries in range(5):
-                try:
-                    await self.confirm()
-                except ConfirmationError:
-                    break
-                except ClientException:
-                    await asyncio.sleep(tries * 2)
+            await self._confirm_with_retries()
+
+    async def _confirm_with_retries(self) -> None:
+        for tries in range(5):
+            try:
+                return await self.confirm()
+            except ConfirmationError:  # the confirmation might not be available yet
+                if tries == 4:
+                    raise
+                await asyncio.sleep(min(1 << tries, 4))
 
     async def decline(self) -> None:
         """Declines the trade offer.
@@ -723,21 +844,21 @@ class TradeOffer:
         resp = await self._state.http.get_trade_receipt(self._id)
         data = resp["response"]
         trade = data["trades"][0]
-        descriptions = data["descriptions"]
+        descriptions = _index_descriptions(data["descriptions"])
 
         received: list[TradeOfferReceiptItem] = []
         for asset in trade.get("assets_received", ()):
-            for item in descriptions:
-                if item["instanceid"] == asset["instanceid"] and item["classid"] == asset["classid"]:
-                    item.update(asset)
-                    received.append(TradeOfferReceiptItem(data=item, owner=self.partner))  # type: ignore
+            item = descriptions.get((asset["instanceid"], asset["classid"]))
+            if item is not None:
+                item.update(asset)
+                received.append(TradeOfferReceiptItem(data=item, owner=self.partner))  # type: ignore
 
         sent: list[TradeOfferReceiptItem] = []
         for asset in trade.get("assets_given", ()):
-            for item in descriptions:
-                if item["instanceid"] == asset["instanceid"] and item["classid"] == asset["classid"]:
-                    item.update(asset)
-                    sent.append(TradeOfferReceiptItem(data=item, owner=self._state.http.user))  # type: ignore
+            item = descriptions.get((asset["instanceid"], asset["classid"]))
+            if item is not None:
+                item.update(asset)
+                sent.append(TradeOfferReceiptItem(data=item, owner=self._state.http.user))  # type: ignore
 
         return TradeOfferReceipt(sent=sent, received=received)
 
@@ -768,7 +889,9 @@ class TradeOffer:
 
     def is_gift(self) -> bool:
         """Helper method that checks if an offer is a gift to the :class:`~steam.ClientUser`"""
-        return bool(self.items_to_receive and not self.items_to_send)
+        to_send = self._items_to_send if self._items_to_send is not None else self._items_to_send_data
+        to_receive = self._items_to_receive if self._items_to_receive is not None else self._items_to_receive_data
+        return bool(to_receive and not to_send)
 
     def is_our_offer(self) -> bool:
         """Whether the offer was created by the :class:`~steam.ClientUser`."""
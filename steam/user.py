@@ -24,14 +24,12 @@ SOFTWARE.
 
 from __future__ import annotations
 
-import asyncio
 from collections.abc import Coroutine
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
 from .abc import BaseUser, Messageable, UserDict
 from .enums import TradeOfferState
-from .errors import ClientException, ConfirmationError
 from .models import URL
 from .profile import OwnedProfileItems, ProfileItem
 
@@ -170,6 +168,8 @@ class User(BaseUser, Messageable["UserMessage"]):
             Sending the message failed.
         :exc:`~steam.Forbidden`
             You do not have permission to send the message.
+        :exc:`~steam.ConfirmationError`
+            No matching confirmation could be found for the trade.
 
         Returns
         -------
@@ -185,13 +185,7 @@ class User(BaseUser, Messageable["UserMessage"]):
             needs_confirmation = resp.get("needs_mobile_confirmation", False)
             trade._update_from_send(self._state, resp, self, active=not needs_confirmation)
             if needs_confirmation:
-                for tries in range(5):
-                    try:
-                        await trade.confirm()
-                    except ConfirmationError:
-                        break
-                    except ClientException:
-                        await asyncio.sleep(tries * 2)
+                await trade._confirm_with_retries()
                 trade.state = TradeOfferState.Active
 
             # make sure the trade is updated before this function returns
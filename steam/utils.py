@@ -32,15 +32,15 @@ import builtins
 import contextvars
 import functools
 import html
-import json
 import re
 import struct
 import sys
 from collections.abc import Awaitable, Callable, Coroutine, Generator, Iterable, Sized
 from inspect import getmembers, isawaitable
 from io import BytesIO
+from itertools import islice
 from operator import attrgetter
-from types import MemberDescriptorType
+from types import CoroutineType, MemberDescriptorType
 from typing import TYPE_CHECKING, Any, Generic, SupportsInt, TypeVar, overload
 
 import aiohttp
@@ -85,6 +85,7 @@ UniverseType: TypeAlias = """
     Universe | Literal['Invalid', 'Public', 'Beta', 'Internal', 'Dev', 'Max', 0, 1, 2, 3, 4, 5, 6]
 """
 InstanceType: TypeAlias = "Literal[0, 1, 2, 4]"
+_DESKTOP_INSTANCE_TYPES: Final = frozenset((Type.Individual, Type.GameServer))  # the types that default to instance 1
 
 
 def make_id64(
@@ -134,7 +135,7 @@ def make_id64(
         return 0
 
     try:
-        id = int(id)
+        id = id if id.__class__ is int else int(id)  # most ids are already ints
     except ValueError:
         # textual input e.g. [g:1:4]
         try:
@@ -149,25 +150,22 @@ def make_id64(
             universe = universe or Universe.Public
         # 64 bit
         elif 2 ** 32 < id < 2 ** 64:
-            value = id
-            id = id & 0xFFFFFFFF
-            instance = (value >> 32) & 0xFFFFF
-            type = (value >> 52) & 0xF
-            universe = (value >> 56) & 0xFF
+            id, instance, type, universe = id & 0xFFFFFFFF, id >> 32 & 0xFFFFF, id >> 52 & 0xF, id >> 56 & 0xFF
         else:
             raise InvalidSteamID(id, "it is too large" if id > 2 ** 64 else "it is too small")
 
+        # look the values up directly rather than going through EnumMeta.__call__, ints and members hash the same
         try:
-            type = Type(type) if isinstance(type, int) else Type[type]
+            type = Type._value_map_[type] if isinstance(type, int) else Type[type]
         except (KeyError, ValueError):
             raise InvalidSteamID(id, f"{type!r} is not a valid Type") from None
         try:
-            universe = Universe(universe) if isinstance(universe, int) else Universe[universe]
+            universe = Universe._value_map_[universe] if isinstance(universe, int) else Universe[universe]
         except (KeyError, ValueError):
             raise InvalidSteamID(id, f"{universe!r} is not a valid Universe") from None
 
     if instance is None:
-        instance = 1 if type in (Type.Individual, Type.GameServer) else 0
+        instance = 1 if type in _DESKTOP_INSTANCE_TYPES else 0
 
     return universe << 56 | type << 52 | instance << 32 | id
 
@@ -198,7 +196,7 @@ def id2_to_tuple(value: str) -> tuple[int, Literal[Type.Individual], Literal[Uni
     if search is None:
         return None
 
-    id = (int(search["id"]) << 1) | int(search["remainder"])
+    id = (int(search["id"]) << 1) | (ord(search["remainder"]) & 1)  # the remainder is only ever "0" or "1"
     universe = int(search["universe"])
 
     # games before orange box used to incorrectly display universe as 0, we support that
@@ -214,6 +212,9 @@ ID3_REGEX = re.compile(
     r"(?P<id>[0-9]{1,10})"
     r"(:(?P<instance>\d+))?]",
 )
+# the regex only lets through known characters and universes so the enums can be looked up directly
+_ID3_TYPES: Final = {"i": Type.Invalid, **{char: Type(type_char) for char, type_char in TypeChar._member_map_.items()}}
+_ID3_UNIVERSES: Final = {str(universe.value): universe for universe in Universe}
 
 
 def id3_to_tuple(value: str) -> tuple[int, Type, Universe, int] | None:
@@ -235,9 +236,9 @@ def id3_to_tuple(value: str) -> tuple[int, Type, Universe, int] | None:
         return None
 
     id = int(search["id"])
-    universe = Universe(int(search["universe"]))
-    type_char = search["type"].replace("i", "I")
-    type = Type(TypeChar[type_char])
+    universe = _ID3_UNIVERSES[search["universe"]]
+    type_char = search["type"]
+    type = _ID3_TYPES[type_char]
     instance = search["instance"]
 
     if type_char in "gT":
@@ -261,8 +262,8 @@ def id3_to_tuple(value: str) -> tuple[int, Type, Universe, int] | None:
 _INVITE_HEX = "0123456789abcdef"
 _INVITE_CUSTOM = "bcdfghjkmnpqrtvw"
 _INVITE_VALID = f"{_INVITE_HEX}{_INVITE_CUSTOM}"
-_INVITE_MAPPING = dict(zip(_INVITE_HEX, _INVITE_CUSTOM))
-_INVITE_INVERSE_MAPPING = dict(zip(_INVITE_CUSTOM, _INVITE_HEX))
+_INVITE_MAPPING = str.maketrans(_INVITE_HEX, _INVITE_CUSTOM)  # for str.translate
+_INVITE_INVERSE_MAPPING = str.maketrans(_INVITE_CUSTOM, _INVITE_HEX)
 INVITE_REGEX = re.compile(rf"(https?://s\.team/p/(?P<code_1>[\-{_INVITE_VALID}]+))|(?P<code_2>[\-{_INVITE_VALID}]+)")
 
 
@@ -289,7 +290,7 @@ def invite_code_to_tuple(
 
     code = (search["code_1"] or search["code_2"]).replace("-", "")
 
-    id = int(re.sub(f"[{_INVITE_CUSTOM}]", lambda m: _INVITE_INVERSE_MAPPING[m.group()], code), 16)
+    id = int(code.translate(_INVITE_INVERSE_MAPPING), 16)
 
     if 0 < id < 2 ** 32:
         return id, Type.Individual, Universe.Public, 1
@@ -298,7 +299,7 @@ def invite_code_to_tuple(
 URL_REGEX = re.compile(
     r"(?P<clean_url>https?(www\.)?://steamcommunity\.com/(?P<type>profiles|id|gid|groups|app|games)/(?P<value>.+))"
 )
-USER_ID64_FROM_URL_REGEX = re.compile(r"g_rgProfileData\s*=\s*(?P<json>{.*?});\s*")
+USER_ID64_FROM_URL_REGEX = re.compile(r'g_rgProfileData\s*=\s*{[^}]*?"steamid"\s*:\s*"(?P<steamid>\d+)"')
 CLAN_ID64_FROM_URL_REGEX = re.compile(r"OpenGroupChat\(\s*'(?P<steamid>\d+)'\s*\)")
 
 
@@ -346,17 +347,11 @@ async def id64_from_url(url: StrOrURL, session: aiohttp.ClientSession | None = N
     session = session or aiohttp.ClientSession()
 
     try:
-        if search["type"] in ("id", "profiles"):
-            # user profile
-            r = await session.get(search["clean_url"])
-            text = await r.text()
-            data_match = USER_ID64_FROM_URL_REGEX.search(text)
-            data = json.loads(data_match["json"])
-        else:
-            # clan profile
-            r = await session.get(search["clean_url"])
-            text = await r.text()
-            data = CLAN_ID64_FROM_URL_REGEX.search(text)
+        r = await session.get(search["clean_url"])
+        text = await r.text()
+        # only the id is needed from the profile data so don't bother parsing the rest of it
+        regex = USER_ID64_FROM_URL_REGEX if search["type"] in ("id", "profiles") else CLAN_ID64_FROM_URL_REGEX
+        data = regex.search(text)
         return int(data["steamid"])
     except (TypeError, AttributeError):
         return None
@@ -365,6 +360,12 @@ async def id64_from_url(url: StrOrURL, session: aiohttp.ClientSession | None = N
             await session.close()
 
 
+TRADE_URL_REGEX = re.compile(
+    r"(?:https?://)?(?:www\.)?steamcommunity\.com/tradeoffer/new/\?partner=(?P<user_id>[0-9]{,10})"
+    r"&token=(?P<token>[\w-]{7,})"
+)
+
+
 def parse_trade_url(url: StrOrURL) -> re.Match[str] | None:
     """Parses a trade URL for useful information.
 
@@ -377,11 +378,7 @@ def parse_trade_url(url: StrOrURL) -> re.Match[str] | None:
     -------
     A :class:`re.Match` object with ``token`` and ``user_id`` :meth:`re.Match.group` objects or ``None``.
     """
-    return re.search(
-        r"(?:https?://)?(?:www\.)?steamcommunity\.com/tradeoffer/new/\?partner=(?P<user_id>[0-9]{,10})"
-        r"&token=(?P<token>[\w-]{7,})",
-        html.unescape(str(url)),
-    )
+    return TRADE_URL_REGEX.search(html.unescape(str(url)))
 
 
 # some backports
@@ -456,8 +453,9 @@ def ainput(prompt: str = "") -> Coroutine[None, None, str]:
     return to_thread(input, prompt)
 
 
-def contains_bbcode(string: str) -> bool:
-    bbcodes = [
+_BBCODE_PREFIXES: Final = tuple(
+    f"/{bbcode}"
+    for bbcode in (
         "me",
         "code",
         "pre",
@@ -476,8 +474,12 @@ def contains_bbcode(string: str) -> bool:
         "roomeffect",
         "img",
         "url",
-    ]
-    return any(string.startswith(f"/{bbcode}") for bbcode in bbcodes)
+    )
+)
+
+
+def contains_bbcode(string: str) -> bool:
+    return string.startswith(_BBCODE_PREFIXES)
 
 
 class SupportsChunk(Protocol[_T_co], Sized):
@@ -486,16 +488,16 @@ class SupportsChunk(Protocol[_T_co], Sized):
 
 
 def chunk(iterable: Iterable[_T], size: int) -> Generator[list[_T], None, None]:
-    chunk = []
-
-    for element in iterable:
-        if len(chunk) == size:
-            yield chunk
-            chunk = []
-        chunk.append(element)
-
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))  # islice fills each chunk in C rather than appending element by element
     yield chunk
 
+    while len(chunk) == size:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 
 def update_class(
     instance: _T,
@@ -678,6 +680,12 @@ def find(predicate: Callable[[_T], bool], iterable: Iterable[_T]) -> _T | None:
     return None
 
 
+@functools.lru_cache(maxsize=128)
+def _attrgetter(attr: str) -> Callable[[Any], Any]:
+    # get() tends to be called with the same attributes over and over so reuse the getters
+    return attrgetter(attr.replace("__", "."))
+
+
 def get(iterable: Iterable[_T], **attrs: Any) -> _T | None:
     """A helper that returns the first element in the iterable that meets all the traits passed in ``attrs``. This
     is an alternative for :func:`find`.
@@ -705,18 +713,18 @@ def get(iterable: Iterable[_T], **attrs: Any) -> _T | None:
 
     # global -> local
     _all = all
-    attrget = attrgetter
+    attrget = _attrgetter
 
     # Special case the single element call
     if len(attrs) == 1:
         k, v = attrs.popitem()
-        pred = attrget(k.replace("__", "."))
+        pred = attrget(k)
         for elem in iterable:
             if pred(elem) == v:
                 return elem
         return None
 
-    converted = [(attrget(attr.replace("__", ".")), value) for attr, value in attrs.items()]
+    converted = [(attrget(attr), value) for attr, value in attrs.items()]
 
     for elem in iterable:
         if _all(pred(elem) == value for pred, value in converted):
@@ -724,13 +732,19 @@ def get(iterable: Iterable[_T], **attrs: Any) -> _T | None:
     return None
 
 
+_NOT_AWAITABLE: Final = frozenset((bool, int, str, list, tuple, type(None)))
+
+
 async def maybe_coroutine(
     func: Callable[_P, _T | Awaitable[_T]],
     *args: _P.args,
     **kwargs: _P.kwargs,
 ) -> _T:
     value = func(*args, **kwargs)
-    if isawaitable(value):
+    # predicates and checks mostly return coroutines or bools, both of which can be told apart without isawaitable's
+    # abc instance checks
+    cls = value.__class__
+    if cls is CoroutineType or (cls not in _NOT_AWAITABLE and isawaitable(value)):
         return await value
     return value
 
@@ -1,5 +1,269 @@
+from copy import copy
+from types import SimpleNamespace
+
+import pytest
+
+import steam
 from steam.ext import commands
 
 bot = commands.Bot(command_prefix="!")
 
 # TODO test kwargs
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "command_prefix, content, expected",
+    [
+        ("!", "!ping", "!"),
+        ("!", "ping", None),
+        (("?", "!"), "!ping", "!"),
+        (["!", "!?"], "!?ping", "!"),
+        ({"$": None}, "$ping", "$"),
+        (lambda bot, message: "!", "!ping", "!"),
+        (lambda bot, message: ["?", "!"], "?ping", "?"),
+    ],
+)
+async def test_get_prefix(command_prefix, content: str, expected) -> None:
+    bot = commands.Bot(command_prefix=command_prefix)
+    assert await bot.get_prefix(SimpleNamespace(content=content)) == expected
+
+
+@pytest.mark.asyncio
+async def test_mutated_prefix() -> None:
+    bot = commands.Bot(command_prefix=["!"])
+    assert await bot.get_prefix(SimpleNamespace(content="?ping")) is None
+
+    bot.command_prefix.append("?")
+    assert await bot.get_prefix(SimpleNamespace(content="?ping")) == "?"
+
+
+@pytest.mark.asyncio
+async def test_invalid_prefix() -> None:
+    with pytest.raises(TypeError):
+        commands.Bot(command_prefix=1)
+    with pytest.raises(TypeError):
+        commands.Bot(command_prefix=["!", 1])
+
+    bot = commands.Bot(command_prefix=lambda bot, message: 1)
+    with pytest.raises(TypeError):
+        await bot.get_prefix(SimpleNamespace(content="!ping"))
+
+
+@pytest.mark.asyncio
+async def test_get_context_only_prefix() -> None:
+    from tests.mocks import GROUP_MESSAGE
+
+    bot = commands.Bot(command_prefix="!", case_insensitive=True)
+    message = copy(GROUP_MESSAGE)
+    message.content = message.clean_content = "!"
+    ctx = await bot.get_context(message)
+    assert ctx.prefix == "!"
+    assert ctx.invoked_with is None
+    assert ctx.command is None
+
+
+@pytest.mark.asyncio
+async def test_process_commands_skips_non_commands() -> None:
+    from tests.mocks import GROUP_MESSAGE
+
+    contexts: "list[commands.Context]" = []
+
+    bot = commands.Bot(command_prefix="!")
+    get_context = bot.get_context
+
+    async def counting_get_context(message, *, cls=commands.Context):
+        ctx = await get_context(message, cls=cls)
+        contexts.append(ctx)
+        return ctx
+
+    bot.get_context = counting_get_context  # patched on the instance so the class still uses Bot.get_context
+    message = copy(GROUP_MESSAGE)
+    message.content = message.clean_content = "not a command"
+    await bot.process_commands(message)
+    assert not contexts
+
+    class CountingBot(commands.Bot):
+        async def get_context(self, message, *, cls=commands.Context):
+            ctx = await super().get_context(message, cls=cls)
+            contexts.append(ctx)
+            return ctx
+
+    bot = CountingBot(command_prefix="!")  # an overridden get_context could match anything, so it must be called
+    await bot.process_commands(message)
+    assert len(contexts) == 1
+
+
+@pytest.mark.asyncio
+async def test_commands_on_subclass() -> None:
+    class MyBot(commands.Bot):
+        @commands.command
+        async def ping(self, ctx: commands.Context) -> None:
+            ...
+
+    class MySubBot(MyBot):
+        @commands.command
+        async def ping(self, ctx: commands.Context) -> None:  # overrides MyBot.ping
+            ...
+
+    bot = MyBot(command_prefix="!")
+    assert bot.get_command("ping") is MyBot.ping
+    assert MyBot.ping.cog is bot
+
+    sub_bot = MySubBot(command_prefix="!")
+    assert sub_bot.get_command("ping") is MySubBot.ping
+
+
+@pytest.mark.asyncio
+async def test_listeners() -> None:
+    bot = commands.Bot(command_prefix="!")
+
+    async def on_message(message) -> None:
+        ...
+
+    async def on_message_2(message) -> None:
+        ...
+
+    bot.add_listener(on_message)
+    bot.add_listener(on_message_2, "on_message")
+    assert bot.__listeners__["on_message"] == (on_message, on_message_2)
+
+    bot.remove_listener(on_message)
+    bot.remove_listener(on_message)  # removing a listener that isn't registered is a noop
+    bot.remove_listener(on_message, "on_something_else")
+    assert bot.__listeners__["on_message"] == (on_message_2,)
+
+
+def test_when_mentioned_or() -> None:
+    bot = SimpleNamespace(user=SimpleNamespace(mention="[mention=1234]@bot[/mention]"))
+    assert commands.when_mentioned_or("!", "?")(bot, None) == ["!", "?", "[mention=1234]@bot[/mention]"]
+    assert commands.when_mentioned(bot, None) == ["[mention=1234]@bot[/mention]"]
+
+
+@pytest.mark.asyncio
+async def test_global_checks() -> None:
+    bot = commands.Bot(command_prefix="!")
+
+    async def can_run(ctx) -> bool:
+        return True
+
+    ctx = SimpleNamespace(command=SimpleNamespace(can_run=can_run))
+    assert await bot.can_run(ctx)
+
+    @bot.check
+    def never(ctx) -> bool:
+        return False
+
+    assert not await bot.can_run(ctx)
+
+    bot.remove_check(never)
+    assert not bot.checks
+    assert await bot.can_run(ctx)
+
+
+@pytest.mark.asyncio
+async def test_hooks_must_be_coroutines() -> None:
+    bot = commands.Bot(command_prefix="!")
+
+    def sync_hook(ctx) -> None:
+        ...
+
+    async def hook(ctx) -> None:
+        ...
+
+    for register in (bot.before_invoke, bot.after_invoke, bot.add_listener):
+        with pytest.raises(TypeError):
+            register(sync_hook)
+
+    assert bot.before_invoke(hook) is hook
+    assert bot.after_invoke(hook) is hook
+    assert bot._before_hook is bot._after_hook is hook
+
+
+@pytest.mark.asyncio
+async def test_bots_do_not_share_state() -> None:
+    bot_1 = commands.Bot(command_prefix="!")
+    bot_2 = commands.Bot(command_prefix="!")
+
+    async def on_message(message) -> None:
+        ...
+
+    bot_1.add_listener(on_message)
+    assert "on_message" not in bot_2.__listeners__
+    assert bot_1.__cogs__ is not bot_2.__cogs__
+    assert bot_1.__extensions__ is not bot_2.__extensions__
+
+
+@pytest.mark.asyncio
+async def test_add_and_remove_commands() -> None:
+    bot = commands.Bot(command_prefix="!")
+
+    @bot.command(aliases=iter(("p",)))
+    async def ping(ctx) -> None:
+        ...
+
+    assert ping.aliases == ("p",)
+    assert bot.get_command("p") is ping
+
+    with pytest.raises(steam.ClientException):
+
+        @bot.command(aliases=("pong", "p"))
+        async def pong_(ctx) -> None:
+            ...
+
+    assert bot.get_command("p") is ping  # the existing alias is left alone
+    assert bot.get_command("pong_") is None
+    assert bot.get_command("pong") is None
+
+    async def pong(ctx) -> None:
+        ...
+
+    case_insensitive_bot = commands.Bot(command_prefix="!", case_insensitive=True)
+    for aliases in (("pong", "pong"), ("PONG_",)):  # clashes within the command itself
+        with pytest.raises(steam.ClientException):
+            case_insensitive_bot.add_command(commands.command(name="pong_", aliases=aliases)(pong))
+    assert case_insensitive_bot.get_command("pong") is None
+
+    assert bot.commands == {ping, bot.help_command}
+    assert bot.commands is bot.commands  # a read-only view is shared until the commands change
+    assert isinstance(bot.commands, frozenset)
+
+    assert bot.remove_command("ping") is ping
+    assert ping not in bot.commands
+    assert bot.get_command("p") is None
+    assert bot.remove_command("ping") is None
+
+    @bot.group
+    async def parent(ctx) -> None:
+        ...
+
+    @parent.command
+    async def child(ctx) -> None:
+        ...
+
+    parent.recursively_remove_all_commands()
+    assert not parent.commands
+    assert parent.get_command("child") is None
+
+
+@pytest.mark.asyncio
+async def test_extensions(tmp_path, monkeypatch) -> None:
+    (tmp_path / "an_extension.py").write_text(
+        "import sys\n"
+        "def setup(bot):\n"
+        "    bot.setup_calls = getattr(bot, 'setup_calls', 0) + 1\n"
+        "def teardown(bot):\n"
+        "    sys.modules.pop(__name__)  # removing itself shouldn't break unloading\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    bot = commands.Bot(command_prefix="!")
+
+    bot.load_extension("an_extension")
+    assert "an_extension" in bot.extensions
+    bot.reload_extension("an_extension")
+    assert bot.setup_calls == 2
+
+    bot.unload_extension("an_extension")
+    assert "an_extension" not in bot.extensions
+    with pytest.raises(ModuleNotFoundError):
+        bot.unload_extension("an_extension")
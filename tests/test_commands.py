@@ -2,13 +2,14 @@ import contextlib
 import traceback
 from copy import copy
 from io import StringIO
-from typing import Any, Generator, Optional, TypeVar, Union
+from typing import Any, Dict, Generator, Optional, TypeVar, Union
 
 import pytest
 from typing_extensions import TypeAlias
 
 import steam
 from steam.ext import commands
+from steam.ext.commands.commands import to_bool
 from tests.mocks import GROUP_MESSAGE
 
 CE = TypeVar("CE", bound=commands.CommandError)
@@ -77,6 +78,52 @@ def test_annotations() -> None:
     assert get_an_user.clean_params.popitem()[1].annotation == UserTypes
 
 
+def test_parsers() -> None:
+    @commands.command
+    async def consume_rest(_, number: int, *, rest: str, ignored: str) -> None:
+        ...
+
+    assert [param.name for _, param, _ in consume_rest._parsers] == ["number", "rest"]  # stops after the first rest
+    assert [param_type for _, _, param_type in consume_rest._parsers] == [int, str]
+    assert consume_rest._parsers is consume_rest._parsers
+
+
+def test_children() -> None:
+    @commands.group
+    async def parent(_) -> None:
+        ...
+
+    @parent.group
+    async def child(_) -> None:
+        ...
+
+    @child.command
+    async def grandchild(_) -> None:
+        ...
+
+    @parent.command(aliases=["sibling_alias"])
+    async def sibling(_) -> None:
+        ...
+
+    children = parent.children
+    assert sorted(c.name for c in children) == ["child", "grandchild", "sibling"]  # aliases aren't duplicated
+    assert children.index(child) < children.index(grandchild)
+    assert child.children == [grandchild]
+    assert grandchild.parent is child
+
+
+@pytest.mark.parametrize(
+    "argument, expected",
+    [("yes", True), ("On", True), ("1", True), ("NO", False), ("off", False), ("0", False), ("maybe", None)],
+)
+def test_to_bool(argument: str, expected: Optional[bool]) -> None:
+    if expected is None:
+        with pytest.raises(commands.BadArgument):
+            to_bool(argument)
+    else:
+        assert to_bool(argument) is expected
+
+
 class CustomConverter(commands.Converter[tuple]):
     async def convert(self, ctx: commands.Context, argument: str) -> tuple:
         ...
@@ -235,6 +282,30 @@ async def test_variadic_commands(input: str, expected_exception: commands.Comman
     await bot.process_commands(input, expected_exception)
 
 
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "input, expected_exception",
+    [
+        ("", commands.MissingRequiredArgument),
+        ("a=1234", None),
+        ("a=1234 b=1234", None),
+        ("a=string", commands.BadArgument),
+        ("a=1234=1234", commands.BadArgument),
+        ("a", commands.UnmatchedKeyValuePair),
+    ],
+)
+async def test_var_keyword_commands(input: str, expected_exception: commands.CommandError) -> None:
+    bot = TheTestBot()
+
+    @bot.command
+    async def test_var_kw(_, **numbers: Dict[str, int]) -> None:
+        for number in numbers.values():
+            assert isinstance(number, int)
+            assert len(str(number)) == 4
+
+    await bot.process_commands(input, expected_exception)
+
+
 @pytest.mark.asyncio
 async def test_positional_only_commands():
     bot = TheTestBot()
@@ -386,6 +457,29 @@ async def test_converters() -> None:
     assert called_image_converter
 
 
+@pytest.mark.asyncio
+async def test_converters_registered_after_use() -> None:
+    bot = TheTestBot()
+
+    class Late:
+        ...
+
+    @bot.command
+    async def late(_, arg: Late) -> None:
+        assert isinstance(arg, Late)
+
+    await bot.process_commands("not convertable yet", commands.BadArgument)
+
+    @commands.converter_for(Late)
+    def late_converter(argument: str) -> Late:
+        return Late()
+
+    try:
+        await bot.process_commands("convertable now", None)
+    finally:
+        commands.converters.CONVERTERS.pop(Late)
+
+
 def teardown_module(_) -> None:
     for error in FAILS:
         traceback.print_exception(error.__class__, error, error.__traceback__)
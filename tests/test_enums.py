@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import pytest
+
+from steam.enums import Enum, IntEnum, PersonaStateFlag, Result, Type, TypeChar
+from steam.game import Games
+
+
+def test_lookup() -> None:
+    assert Result(1) is Result.OK
+    assert Result["OK"] is Result.OK
+    assert Type(1) is Type.Individual
+    assert TypeChar.T is TypeChar.L  # aliases share a member
+
+    with pytest.raises(ValueError):
+        Result(4)
+    with pytest.raises(ValueError):
+        Result([])
+
+
+def test_members() -> None:
+    assert Result.OK.name == "OK"
+    assert Result.OK.value == 1
+    assert isinstance(Result.OK, int)
+    assert len(Type) == len(Type.__members__)
+    assert Type.__members__ is Type.__members__
+    assert list(Type) == list(Type.__members__.values())
+    assert list(reversed(Type)) == list(Type)[::-1]
+    assert Result.OK in Result
+    assert Result.try_value(4) not in Result
+
+
+def test_try_value() -> None:
+    assert Result.try_value(1) is Result.OK
+
+    unknown = Result.try_value(4)
+    assert isinstance(unknown, Result)
+    assert unknown.name == "ResultUnknownValue"
+    assert unknown.value == 4
+    assert Result.try_value(4) is unknown  # unknown values are interned
+    assert Result._unknown_map_ is not Type._unknown_map_
+
+
+def test_flags() -> None:
+    flags = PersonaStateFlag.try_value(3)
+    assert flags.value == 3
+    assert flags == PersonaStateFlag.HasRichPresence | PersonaStateFlag.InJoinableGame
+    assert flags & PersonaStateFlag.HasRichPresence
+    assert PersonaStateFlag.try_value(3) is flags
+    assert PersonaStateFlag.try_value(0) is PersonaStateFlag.NONE
+    assert PersonaStateFlag.try_value(1) is PersonaStateFlag.HasRichPresence
+
+
+def test_str_and_repr() -> None:
+    assert str(Result.OK) == "Result.OK"
+    assert repr(Result.OK) == "<Result.OK: 1>"
+    assert str(Result.try_value(4)) == "Result.ResultUnknownValue"
+    assert repr(PersonaStateFlag.try_value(3)) == "<PersonaStateFlag.HasRichPresence | InJoinableGame: 3>"
+
+
+def test_mixins() -> None:
+    assert Result._is_mixin_
+    assert not Enum._is_mixin_
+    assert IntEnum._is_mixin_
+    assert Games.TF2.id == 440
+    assert repr(Games.TF2) == "TF2"
+
+
+def test_int_comparisons() -> None:
+    # IntEnum members are ints, comparisons should go straight through int's slots
+    for name in ("__eq__", "__ne__", "__hash__", "__lt__", "__le__", "__gt__", "__ge__"):
+        assert getattr(Result, name) is getattr(int, name)
+    assert Result.OK < Result.Fail <= 2
+    assert Result.OK == 1 and Result(1) == Result.OK
+    assert sorted([Result.Fail, Result.OK, Result.Invalid]) == [Result.Invalid, Result.OK, Result.Fail]
@@ -32,6 +32,7 @@ from typing import Optional, Union
 import pytest
 
 from steam import InvalidSteamID, SteamID, Type, Universe
+from steam.utils import invite_code_to_tuple
 
 
 def test_hash() -> None:
@@ -241,3 +242,16 @@ def test_as_invite_code(steam_id: SteamID, invite_code: Optional[str]) -> None:
 )
 def test_as_invite_url(steam_id: SteamID, invite_url: Optional[str]) -> None:
     assert steam_id.invite_url == invite_url
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [
+        ["cv-dgb", (123456, Type.Individual, Universe.Public, 1)],
+        ["https://s.team/p/cv-dgb", (123456, Type.Individual, Universe.Public, 1)],
+        ["b", None],
+        ["", None],
+    ],
+)
+def test_invite_code_to_tuple(code: str, expected: Optional[tuple[int, Type, Universe, int]]) -> None:
+    assert invite_code_to_tuple(code) == expected
@@ -0,0 +1,189 @@
+import asyncio
+from datetime import datetime
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from steam import ConfirmationError, Game, TradeOffer, TradeOfferState, utils
+from steam.trade import Asset, BaseInventory, Inventory, Item
+
+
+def item_data(asset_id: int, **kwargs: Any) -> "dict[str, Any]":
+    return {
+        "assetid": str(asset_id),
+        "amount": "1",
+        "instanceid": "0",
+        "classid": str(100 + asset_id),
+        "appid": "440",
+        "contextid": "2",
+        "market_name": f"Item {asset_id}",
+        **kwargs,
+    }
+
+
+OFFER_DATA = {
+    "tradeofferid": "1234",
+    "accountid_other": 287788226,
+    "trade_offer_state": 2,
+    "items_to_give": [item_data(1), item_data(2)],
+    "items_to_receive": [item_data(3)],
+    "time_created": 1600000000,
+    "time_updated": 1650000000,
+    "expiration_time": 1700000000,
+}
+
+
+def test_offer_update_reuses_items() -> None:
+    offer = TradeOffer._from_api(None, OFFER_DATA)
+    assert offer.id == 1234
+    assert offer.state == TradeOfferState.Active
+    assert not offer.is_gift()
+    assert offer._items_to_send is None  # items are only built when they're accessed
+    assert [item.name for item in offer.items_to_send] == ["Item 1", "Item 2"]
+    assert [item.name for item in offer.items_to_receive] == ["Item 3"]
+
+    second_item = offer.items_to_send[1]
+    offer._update({**OFFER_DATA, "items_to_give": [item_data(2), item_data(4)]})
+    assert offer.items_to_send[0] is second_item
+    assert [item.name for item in offer.items_to_send] == ["Item 2", "Item 4"]
+
+
+def test_offer_equality() -> None:
+    offer = TradeOffer._from_api(None, OFFER_DATA)
+    same_offer = TradeOffer._from_api(None, OFFER_DATA)
+    assert offer == same_offer
+    assert len({offer, same_offer}) == 1
+
+    unsent = TradeOffer()
+    assert unsent == unsent
+    assert unsent != TradeOffer()
+    assert len({unsent, TradeOffer(), offer}) == 3
+
+    unsent_hash = hash(unsent)
+    unsent._update_from_send(None, {"tradeofferid": OFFER_DATA["tradeofferid"]}, None)
+    unsent._has_been_sent = True
+    assert hash(unsent) != unsent_hash  # the hash switches to the offer's id once it has been sent
+    assert hash(unsent) == hash(offer)
+    assert unsent == offer
+
+
+def test_offer_timestamps() -> None:
+    offer = TradeOffer._from_api(None, OFFER_DATA)
+    assert offer.created_at == datetime(2020, 9, 13, 12, 26, 40)
+    assert offer.updated_at == datetime.utcfromtimestamp(1650000000)
+    assert offer.expires == datetime.utcfromtimestamp(1700000000)
+    assert offer.escrow is None
+    assert TradeOffer().created_at is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("available_after, expected_exception", [(0, None), (2, None), (5, ConfirmationError)])
+async def test_accept_retries_confirmation(monkeypatch, available_after: int, expected_exception) -> None:
+    attempts = 0
+
+    async def accept_user_trade(user_id64: int, trade_id: int) -> "dict[str, Any]":
+        return {"needs_mobile_confirmation": True}
+
+    async def fetch_and_confirm_confirmation(trade_id: int) -> bool:
+        nonlocal attempts
+        attempts += 1
+        return attempts > available_after
+
+    async def sleep(delay: float) -> None:
+        assert delay <= 4
+
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    state = SimpleNamespace(
+        http=SimpleNamespace(accept_user_trade=accept_user_trade),
+        fetch_and_confirm_confirmation=fetch_and_confirm_confirmation,
+        _confirmations={1234: None},
+    )
+    offer = TradeOffer._from_api(state, OFFER_DATA, partner=SimpleNamespace(id64=76561198248053954))
+    if expected_exception is None:
+        await offer.accept()
+    else:
+        with pytest.raises(expected_exception):
+            await offer.accept()
+    assert attempts == min(available_after + 1, 5)
+
+
+@pytest.mark.asyncio
+async def test_receipt() -> None:
+    def asset(asset_id: int) -> "dict[str, Any]":
+        data = item_data(asset_id, new_assetid=str(asset_id * 10), new_contextid="2")
+        del data["market_name"]
+        return data
+
+    async def get_trade_receipt(trade_id: int) -> "dict[str, Any]":
+        return {
+            "response": {
+                "trades": [{"assets_received": [asset(3), asset(5)], "assets_given": [asset(1)]}],
+                "descriptions": [
+                    {"instanceid": "0", "classid": str(100 + asset_id), "market_name": f"Item {asset_id}"}
+                    for asset_id in (1, 3)
+                ],
+            }
+        }
+
+    state = SimpleNamespace(http=SimpleNamespace(get_trade_receipt=get_trade_receipt, user=None))
+    offer = TradeOffer._from_api(state, {**OFFER_DATA, "tradeid": "5678"})
+    sent, received = await offer.receipt()
+    assert [(item.name, item.new_asset_id) for item in sent] == [("Item 1", 10)]
+    assert [(item.name, item.new_asset_id) for item in received] == [("Item 3", 30)]  # 5 has no description
+
+
+Backpack = BaseInventory[Item]
+
+
+def test_inventory_aliases() -> None:
+    assert repr(Backpack) == "steam.trade.Backpack"
+
+    def get_alias() -> Any:
+        return BaseInventory[Item]
+
+    assert get_alias() is get_alias()  # each call site is only inspected once
+
+
+INVENTORY_DATA = {
+    "assets": [
+        {"assetid": "1", "amount": "1", "instanceid": "0", "classid": "101", "appid": "440", "contextid": "2"},
+        {"assetid": "2", "amount": "1", "instanceid": "0", "classid": "999", "appid": "440", "contextid": "2"},
+    ],
+    "descriptions": [{"instanceid": "0", "classid": "101", "market_name": "Item 1"}],
+}
+
+
+class WrappedItem(Item):
+    __slots__ = ("wrapped",)
+
+    def __init__(self, item: Item):
+        utils.update_class(item, self)
+        self.wrapped = item
+
+
+def test_inventory_items() -> None:
+    inventory = Inventory(None, INVENTORY_DATA, None, Game(id=440))
+    item, asset = inventory.items
+    assert type(item) is Item and item.name == "Item 1"
+    assert type(asset) is Asset and asset.asset_id == 2
+    assert item in inventory and asset in inventory
+    assert Asset(item_data(5), owner=None) not in inventory
+    assert len({item, asset, item}) == 2
+
+    assert inventory.get_item("Item 1") is item
+    assert inventory.get_item("Item 2") is None
+    assert inventory.filter_items("Item 1") == [item]
+    assert inventory.filter_items("Item 1", limit=0) == []
+    assert inventory.filter_items("Item 1", "Item 2") == [item]
+    inventory.filter_items("Item 1").clear()  # a copy is returned
+    assert inventory.get_item("Item 1") is item
+
+    empty_inventory = Inventory(None, {"success": 1, "total_inventory_count": 0}, None, Game(id=440))
+    assert not empty_inventory.items
+    assert item not in empty_inventory
+    assert empty_inventory.get_item("Item 1") is None
+
+    inventory = BaseInventory[WrappedItem](None, INVENTORY_DATA, None, Game(id=440))
+    assert isinstance(inventory.items[0], WrappedItem)
+    assert inventory.items[0].wrapped.name == "Item 1"
@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+import asyncio
 import random
 from typing import NamedTuple, Optional
 
@@ -44,6 +45,42 @@ def test_get() -> None:
     assert utils.get(instances, data=model_to_find.data) == model_to_find
 
 
+def test_get_attribute_chains() -> None:
+    class Owner(NamedTuple):
+        name: str
+
+    class Item(NamedTuple):
+        name: str
+        owner: Owner
+
+    items = [Item("a", Owner("b")), Item("b", Owner("a")), Item("b", Owner("b"))]
+    assert utils.get(items, owner__name="a") is items[1]
+    assert utils.get(items, name="b", owner__name="b") is items[2]
+    assert utils.get(items, name="c") is None
+
+
+@pytest.mark.parametrize(
+    "iterable, expected",
+    [
+        ([], [[]]),
+        ([1, 2, 3], [[1, 2, 3]]),
+        ([1, 2, 3, 4], [[1, 2, 3], [4]]),
+        (range(6), [[0, 1, 2], [3, 4, 5]]),
+        (iter(range(7)), [[0, 1, 2], [3, 4, 5], [6]]),
+    ],
+)
+def test_chunk(iterable, expected: "list[list[int]]") -> None:
+    assert list(utils.chunk(iterable, 3)) == expected
+
+
+@pytest.mark.parametrize(
+    "string, expected",
+    [("/me waves", True), ("/tradeofferlink", True), ("/url", True), ("hello /me", False), ("me", False), ("", False)],
+)
+def test_contains_bbcode(string: str, expected: bool) -> None:
+    assert utils.contains_bbcode(string) is expected
+
+
 @pytest.mark.asyncio
 async def test_maybe_coroutine() -> None:
     def function_1() -> int:
@@ -56,6 +93,47 @@ async def test_maybe_coroutine() -> None:
 
     assert await utils.maybe_coroutine(function_2) == 2
 
+    class CustomAwaitable:
+        def __await__(self):
+            yield from asyncio.sleep(0).__await__()
+            return 3
+
+    assert await utils.maybe_coroutine(CustomAwaitable) == 3
+    assert await utils.maybe_coroutine(lambda: None) is None
+    assert await utils.maybe_coroutine(lambda: False) is False
+
+
+class FakeSession:  # doubles as its own response
+    def __init__(self, text: str) -> None:
+        self._text = text
+
+    async def get(self, url: str) -> FakeSession:
+        return self
+
+    async def text(self) -> str:
+        return self._text
+
+
+PROFILE = (
+    "<script>g_rgProfileData = "
+    '{"url":"https:\\/\\/steamcommunity.com\\/id\\/gobot1234\\/","steamid":"76561198248053954",'
+    '"personaname":"Gobot1234","summary":"{}"};</script>'
+)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "url, text, expected",
+    [
+        ("https://steamcommunity.com/id/gobot1234", PROFILE, 76561198248053954),
+        ("https://steamcommunity.com/groups/Valve", "OpenGroupChat( '103582791429521412' )", 103582791429521412),
+        ("https://steamcommunity.com/id/gobot1234", "<html></html>", None),
+        ("https://example.com/id/gobot1234", PROFILE, None),
+    ],
+)
+async def test_id64_from_url(url: str, text: str, expected: Optional[int]) -> None:
+    assert await utils.id64_from_url(url, FakeSession(text)) == expected
+
 
 user_1 = {
     "user_id": "440528954",